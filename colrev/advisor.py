@@ -650,10 +650,10 @@ class Advisor:
             outlets = []
             for line in file.readlines():
                 if line.lstrip()[:8] == "journal ":
-                    journal = line[line.find("{") + 1 : line.rfind("}")]
+                    journal = line.partition("{")[2].rpartition("}")[0]
                     outlets.append(journal)
                 if line.lstrip()[:10] == "booktitle ":
-                    booktitle = line[line.find("{") + 1 : line.rfind("}")]
+                    booktitle = line.partition("{")[2].rpartition("}")[0]
                     outlets.append(booktitle)
 
         outlet_counter: typing.List[typing.Tuple[str, int]] = [
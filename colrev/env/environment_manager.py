@@ -349,14 +349,14 @@ class EnvironmentManager:
                             "journal" == line.lstrip()[:7]
                             and "journal:" != line.lstrip()[:8]
                         ):
-                            journal = line[line.find("{") + 1 : line.rfind("}")]
+                            journal = line.partition("{")[2].rpartition("}")[0]
                             if journal != "UNKNOWN":
                                 outlets.append(journal)
                         if (
                             line.lstrip()[:9] == "booktitle"
                             and line.lstrip()[:10] != "booktitle:"
                         ):
-                            booktitle = line[line.find("{") + 1 : line.rfind("}")]
+                            booktitle = line.partition("{")[2].rpartition("}")[0]
                             if booktitle != "UNKNOWN":
                                 outlets.append(booktitle)
 
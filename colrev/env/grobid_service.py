@@ -15,6 +15,10 @@ class GrobidService:
     """An environment service for machine readability/annotation (PDF to TEI conversion)"""
 
     GROBID_URL = "http://localhost:8070"
+    MAX_WAIT_SECONDS = 20
+    # Note : the session (and its connections) is shared by all instances
+    # because a GrobidService is created for each TEI
+    session = requests.Session()
 
     def __init__(
         self, *, environment_manager: colrev.env.environment_manager.EnvironmentManager
@@ -27,23 +31,22 @@ class GrobidService:
 
     def check_grobid_availability(self, *, wait: bool = True) -> bool:
         """Check whether the GROBID service is available"""
-        i = 0
+        # Note : poll with an exponential backoff (GROBID often starts within seconds)
+        delay = 0.1
+        start_time = time.monotonic()
         while True:
-            i += 1
-            time.sleep(1)
             try:
-                ret = requests.get(self.GROBID_URL + "/api/isalive", timeout=30)
+                ret = self.session.get(self.GROBID_URL + "/api/isalive", timeout=30)
                 if ret.text == "true":
                     return True
             except requests.exceptions.ConnectionError:
                 pass
             if not wait:
                 return False
-            if i == -1:
-                break
-            if i > 20:
+            if time.monotonic() - start_time > self.MAX_WAIT_SECONDS:
                 raise requests.exceptions.ConnectionError()
-        return True
+            time.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
 
     def start(self) -> None:
         """Start the GROBID service"""
@@ -2,6 +2,8 @@
 """Service to detect languages and handle language codes"""
 from __future__ import annotations
 
+import typing
+
 import pycountry
 from lingua.builder import LanguageDetectorBuilder
 
@@ -14,24 +16,78 @@ class LanguageService:
 
     __eng_false_negatives = ["editorial", "introduction"]
 
-    def __init__(self) -> None:
+    DETECTOR_BACKENDS = ["lingua", "langid"]
+
+    # Note : the language code mappings are shared by all instances
+    # (loaded once, on first use)
+    __lang_code_mapping: typing.Dict[str, str] = {}
+    __alpha_2_mapping: typing.Dict[str, str] = {}
+
+    def __init__(self, *, detector_backend: str = "lingua") -> None:
         # Note : Lingua is tested/evaluated relative to other libraries:
         # https://github.com/pemistahl/lingua-py
         # It performs particularly well for short strings (single words/word pairs)
         # The langdetect library is non-deterministic, especially for short strings
         # https://pypi.org/project/langdetect/
+        # py3langid (optional backend) is deterministic and considerably faster
+        # (compiled model, no per-language n-gram models to load)
+        # https://github.com/adbar/py3langid
+
+        if detector_backend not in self.DETECTOR_BACKENDS:
+            raise colrev_exceptions.ParameterError(
+                parameter="detector_backend",
+                value=detector_backend,
+                options=self.DETECTOR_BACKENDS,
+            )
+        self.__detector_backend = detector_backend
+        if detector_backend == "langid":
+            self.__langid_language_identifier = self.__get_langid_language_identifier()
+        else:
+            self.__lingua_language_detector = (
+                LanguageDetectorBuilder.from_all_languages_with_latin_script().build()
+            )
 
-        self.__lingua_language_detector = (
-            LanguageDetectorBuilder.from_all_languages_with_latin_script().build()
-        )
+        if not self.__lang_code_mapping:
+            self.__load_lang_code_mappings()
+
+        # Note : the detected languages are cached across records
+        # (e.g., duplicates from different sources share the same titles)
+        self.__language_cache: typing.Dict[str, str] = {}
 
+    @classmethod
+    def __load_lang_code_mappings(cls) -> None:
         # Language formats: ISO 639-1 standard language codes
         # https://pypi.org/project/langcodes/
         # https://github.com/flyingcircusio/pycountry
 
-        self.__lang_code_mapping = {}
         for country in pycountry.languages:
-            self.__lang_code_mapping[country.name.lower()] = country.alpha_3
+            cls.__lang_code_mapping[country.name.lower()] = country.alpha_3
+            if hasattr(country, "alpha_2"):
+                cls.__alpha_2_mapping[country.alpha_2] = country.alpha_3
+
+    def __get_langid_language_identifier(self):  # type: ignore
+        try:
+            # pylint: disable=import-outside-toplevel
+            from py3langid.langid import LanguageIdentifier
+            from py3langid.langid import MODEL_FILE
+        except (ImportError, ModuleNotFoundError) as exc:
+            raise colrev_exceptions.MissingDependencyError(
+                "Dependency py3langid not found. "
+                "Please install it\n  pip install py3langid"
+            ) from exc
+
+        return LanguageIdentifier.from_pickled_model(MODEL_FILE, norm_probs=True)
+
+    def __detect_language(self, *, text: str) -> str:
+        if self.__detector_backend == "langid":
+            # langid returns ISO 639-1 codes
+            language_code, _ = self.__langid_language_identifier.classify(text)
+            return self.__alpha_2_mapping.get(language_code, "")
+
+        language = self.__lingua_language_detector.detect_language_of(text)
+        if language:
+            return language.iso_code_639_3.name.lower()
+        return ""
 
     def compute_language(self, *, text: str) -> str:
         """Compute the most likely language code"""
@@ -39,10 +95,9 @@ class LanguageService:
         if text.lower() in self.__eng_false_negatives:
             return "eng"
 
-        language = self.__lingua_language_detector.detect_language_of(text)
-        if language:
-            return language.iso_code_639_3.name.lower()
-        return ""
+        if text not in self.__language_cache:
+            self.__language_cache[text] = self.__detect_language(text=text)
+        return self.__language_cache[text]
 
     def compute_language_confidence_values(self, *, text: str) -> list:
         """Computes the most likely languages of a string and their language codes"""
@@ -50,6 +105,12 @@ class LanguageService:
         if text.lower() in self.__eng_false_negatives:
             return [("eng", 1.0)]
 
+        if self.__detector_backend == "langid":
+            return [
+                (self.__alpha_2_mapping.get(language_code, ""), conf)
+                for language_code, conf in self.__langid_language_identifier.rank(text)
+            ]
+
         predictions = (
             self.__lingua_language_detector.compute_language_confidence_values(
                 text=text
@@ -8,17 +8,17 @@ import json
 import os
 import sqlite3
 import typing
+import zlib
 from copy import deepcopy
-from datetime import timedelta
 from multiprocessing import Lock
 from pathlib import Path
-from threading import Timer
+from xml.etree.ElementTree import ParseError  # nosec
 
 import git
-import requests_cache
 from git.exc import GitCommandError
 from pybtex.database.input import bibtex
-from thefuzz import fuzz
+from rapidfuzz import fuzz
+from rapidfuzz import process
 from tqdm import tqdm
 
 import colrev.dataset
@@ -39,6 +39,8 @@ import colrev.ui_cli.cli_colors as colors
 class LocalIndex:
     """The LocalIndex implements indexing and retrieval of records across projects"""
 
+    # pylint: disable=too-many-instance-attributes
+
     global_keys = ["doi", "dblp_key", "colrev_pdf_id", "url", "colrev_id"]
     max_len_sha256 = 2**256
     request_timeout = 90
@@ -68,22 +70,43 @@ class LocalIndex:
 
     SELECT_LAYERD_FIELDS_QUERY = "SELECT layered_fields FROM record_index WHERE id=?"
 
+    # Note : append a colrev_id to an existing toc item (if it is not yet included)
+    # The query must be executed for each colrev_id individually.
+    UPSERT_TOC_QUERY = """
+            INSERT INTO toc_index VALUES(?, ?)
+            ON CONFLICT(toc_key) DO UPDATE SET
+            colrev_ids=colrev_ids || ';' || excluded.colrev_ids
+            WHERE instr(';' || colrev_ids || ';', ';' || excluded.colrev_ids || ';')=0"""
+
+    # Note : records are reconstructed from the bibtex and layered_fields columns.
+    # Selecting only these columns avoids loading large fields (e.g., the fulltext)
+    RECORD_COLUMNS = "bibtex, layered_fields"
+
+    # Note : SQLite limits the number of variables in a query (999 before 3.32)
+    MAX_QUERY_VARIABLES = 900
+
     SELECT_ALL_QUERIES = {
         TOC_INDEX: "SELECT * FROM toc_index WHERE",
-        RECORD_INDEX: "SELECT * FROM record_index WHERE",
+        RECORD_INDEX: f"SELECT {RECORD_COLUMNS} FROM record_index WHERE",
     }
 
     SELECT_KEY_QUERIES = {
-        (RECORD_INDEX, "id"): "SELECT * FROM record_index WHERE id=?",
+        (RECORD_INDEX, "id"): f"SELECT {RECORD_COLUMNS} FROM record_index WHERE id=?",
         (TOC_INDEX, "toc_key"): "SELECT * FROM toc_index WHERE toc_key=?",
-        (RECORD_INDEX, "colrev_id"): "SELECT * FROM record_index WHERE colrev_id=?",
-        (RECORD_INDEX, "doi"): "SELECT * FROM record_index where doi=?",
-        (RECORD_INDEX, "dblp_key"): "SELECT * FROM record_index WHERE dblp_key=?",
+        (
+            RECORD_INDEX,
+            "colrev_id",
+        ): f"SELECT {RECORD_COLUMNS} FROM record_index WHERE colrev_id=?",
+        (RECORD_INDEX, "doi"): f"SELECT {RECORD_COLUMNS} FROM record_index where doi=?",
+        (
+            RECORD_INDEX,
+            "dblp_key",
+        ): f"SELECT {RECORD_COLUMNS} FROM record_index WHERE dblp_key=?",
         (
             RECORD_INDEX,
             "colrev_pdf_id",
-        ): "SELECT * FROM record_index WHERE colrev_pdf_id=?",
-        (RECORD_INDEX, "url"): "SELECT * FROM record_index WHERE url=?",
+        ): f"SELECT {RECORD_COLUMNS} FROM record_index WHERE colrev_pdf_id=?",
+        (RECORD_INDEX, "url"): f"SELECT {RECORD_COLUMNS} FROM record_index WHERE url=?",
     }
 
     # AUTHOR_INDEX = "author_index"
@@ -99,6 +122,7 @@ class LocalIndex:
         "file",
         "tei",
         "fulltext",
+        "tei_compressed",
         "url",
         "doi",
         "dblp_key",
@@ -108,6 +132,28 @@ class LocalIndex:
         # "curation_ID"
     ]
 
+    # Fields that are removed before records are returned from the LocalIndex
+    RETURN_DROP_KEYS = frozenset(
+        {
+            "colrev_origin",
+            "fulltext",
+            "tei_file",
+            "grobid-version",
+            "excl_criteria",
+            "exclusion_criteria",
+            "screening_criteria",
+            "local_curated_metadata",
+            "metadata_source_repository_paths",
+        }
+    )
+    FILE_KEYS = frozenset({"file", "colrev_pdf_id"})
+    RETURN_DROP_KEYS_NO_FILE = RETURN_DROP_KEYS | FILE_KEYS
+
+    # Fields that are not indexed
+    # Note : numbers of citations change regularly.
+    # They should be retrieved from sources like crossref/doi.org
+    INDEX_DROP_KEYS = frozenset({"screening_criteria", "cited_by"})
+
     # Note: we need the local_curated_metadata field for is_duplicate()
 
     def __init__(
@@ -119,6 +165,11 @@ class LocalIndex:
         self.verbose_mode = verbose_mode
         self.environment_manager = colrev.env.environment_manager.EnvironmentManager()
         self.__index_tei = index_tei
+        # Note : records retrieved for is_duplicate() (None: not in the index)
+        self.__duplicate_candidates: typing.Dict[tuple, typing.Optional[dict]] = {}
+        # Note : colrev_ids and years per toc_key (records often share a toc)
+        self.__toc_items: typing.Dict[str, list] = {}
+        self.__toc_years: typing.Dict[str, str] = {}
 
         self.thread_lock = Lock()
 
@@ -137,10 +188,8 @@ class LocalIndex:
             ret_dict[col[0]] = row[idx]
         return ret_dict
 
-    def __get_record_hash(self, *, record_dict: dict) -> str:
-        # Note : may raise NotEnoughDataToIdentifyException
-        string_to_hash = colrev.record.Record(data=record_dict).create_colrev_id()
-        return hashlib.sha256(string_to_hash.encode("utf-8")).hexdigest()
+    def __get_record_hash(self, *, colrev_id: str) -> str:
+        return hashlib.sha256(colrev_id.encode("utf-8")).hexdigest()
 
     # def __increment_hash(self, *, paper_hash: str) -> str:
     #     plaintext = binascii.unhexlify(paper_hash)
@@ -179,37 +228,75 @@ class LocalIndex:
     #             author_dict = {**author_dict, **author_detail}
     #     self.open_search.index(index=self.AUTHOR_INDEX, body=author_dict)
 
-    def __index_tei_document(self, *, recs_to_index: list) -> None:
+    def __get_pdf_stamp(self, *, record_dict: dict, pdf_path: Path) -> str:
+        # Note : in contrast to the modification time, the colrev_pdf_id
+        # does not change when a repository is cloned
+        if "colrev_pdf_id" in record_dict:
+            return record_dict["colrev_pdf_id"]
+        pdf_stat = pdf_path.stat()
+        return f"{pdf_stat.st_size}-{pdf_stat.st_mtime_ns}"
+
+    def __index_tei_document(self, *, record_dict: dict) -> None:
         if not self.__index_tei:
             return
-        for record_dict in recs_to_index:
-            if not Path(record_dict.get("file", "NA")).is_file():
-                continue
+        if not Path(record_dict.get("file", "NA")).is_file():
+            return
 
-            try:
-                paper_hash = record_dict["id"]
-                tei_path = self.__get_tei_index_file(paper_hash=paper_hash)
-                tei_path.parents[0].mkdir(exist_ok=True, parents=True)
-                if not tei_path.is_file():
-                    print(f"Create tei for {record_dict['file']}")
-                tei = colrev.env.tei_parser.TEIParser(
-                    environment_manager=self.environment_manager,
-                    pdf_path=Path(record_dict["file"]),
-                    tei_path=tei_path,
-                )
+        try:
+            paper_hash = record_dict["id"]
+            pdf_path = Path(record_dict["file"])
+            tei_path = self.__get_tei_index_file(paper_hash=paper_hash)
+            tei_path.parents[0].mkdir(exist_ok=True, parents=True)
+            # Note : the stamp identifies the PDF from which the TEI was created
+            # (TEIs created before stamps were introduced are reused)
+            stamp_path = tei_path.with_suffix(".stamp")
+            pdf_stamp = self.__get_pdf_stamp(record_dict=record_dict, pdf_path=pdf_path)
+
+            tei = None
+            if tei_path.is_file() and (
+                not stamp_path.is_file()
+                or stamp_path.read_text(encoding="utf-8") == pdf_stamp
+            ):
+                try:
+                    # Note : parsing validates the existing TEI
+                    tei = colrev.env.tei_parser.TEIParser(
+                        environment_manager=self.environment_manager,
+                        tei_path=tei_path,
+                    )
+                except (colrev_exceptions.TEIException, ParseError):
+                    tei = None
 
-                record_dict["tei"] = str(tei_path)
-                record_dict["fulltext"] = tei.get_tei_str()
+            if tei is None:
+                print(f"Create tei for {record_dict['file']}")
+                # Note : the existing TEI is only replaced if GROBID succeeds
+                tmp_tei_path = tei_path.with_suffix(".tmp")
+                try:
+                    tei = colrev.env.tei_parser.TEIParser(
+                        environment_manager=self.environment_manager,
+                        pdf_path=pdf_path,
+                        tei_path=tmp_tei_path,
+                    )
+                    tmp_tei_path.replace(tei_path)
+                    stamp_path.write_text(pdf_stamp, encoding="utf-8")
+                finally:
+                    tmp_tei_path.unlink(missing_ok=True)
 
-                # self.__index_author(tei=tei, record_dict=record_dict)
+            fulltext = tei.get_tei_str()
 
-            except (
-                colrev_exceptions.TEIException,
-                AttributeError,
-                FileNotFoundError,
-                colrev_exceptions.ServiceNotAvailableException,
-            ):  # pragma: no cover
-                pass
+            record_dict["tei"] = str(tei_path)
+            # Note : TEI documents are large but compress well.
+            # They are stored in a separate column to keep the fulltext queryable.
+            record_dict["tei_compressed"] = zlib.compress(fulltext.encode("utf-8"))
+
+            # self.__index_author(tei=tei, record_dict=record_dict)
+
+        except (
+            colrev_exceptions.TEIException,
+            AttributeError,
+            FileNotFoundError,
+            colrev_exceptions.ServiceNotAvailableException,
+        ):  # pragma: no cover
+            pass
 
     def __amend_record(
         self, *, cur: sqlite3.Cursor, item: dict, curated_fields: list
@@ -249,71 +336,62 @@ class LocalIndex:
         if "journal" not in record_dict and record_dict["ENTRYTYPE"] != "article":
             return fields_to_remove
 
-        internal_record_dict = deepcopy(record_dict)
-
-        if all(x in internal_record_dict.keys() for x in ["volume", "number"]):
+        if all(x in record_dict.keys() for x in ["volume", "number"]):
             try:
-                toc_key_full = colrev.record.Record(
-                    data=internal_record_dict
-                ).get_toc_key()
+                toc_key_full = colrev.record.Record(data=record_dict).get_toc_key()
 
                 if self.__toc_exists(toc_item=toc_key_full):
                     return fields_to_remove
             except colrev_exceptions.NotTOCIdentifiableException:
                 return fields_to_remove
-            wo_nr = deepcopy(internal_record_dict)
-            del wo_nr["number"]
-            toc_key_wo_nr = colrev.record.Record(data=wo_nr).get_toc_key()
-
-            if toc_key_wo_nr != "NA":
-                if self.__toc_exists(toc_item=toc_key_wo_nr):
-                    fields_to_remove.append("number")
-                    return fields_to_remove
 
-            wo_vol = deepcopy(internal_record_dict)
-            del wo_vol["volume"]
-            toc_key_wo_vol = colrev.record.Record(data=wo_vol).get_toc_key()
-            if toc_key_wo_vol != "NA":
-                if self.__toc_exists(toc_item=toc_key_wo_vol):
-                    fields_to_remove.append("volume")
-                    return fields_to_remove
+            # Note : only toc_keys of articles contain the volume and number
+            if record_dict["ENTRYTYPE"] != "article":
+                return fields_to_remove
 
-            wo_vol_nr = deepcopy(internal_record_dict)
-            del wo_vol_nr["volume"]
-            del wo_vol_nr["number"]
-            toc_key_wo_vol_nr = colrev.record.Record(data=wo_vol_nr).get_toc_key()
-            if toc_key_wo_vol_nr != "NA":
-                if self.__toc_exists(toc_item=toc_key_wo_vol_nr):
-                    fields_to_remove.append("number")
-                    fields_to_remove.append("volume")
+            # Derive the toc_keys without volume/number from the full toc_key
+            # (instead of copying the record and creating the toc_key repeatedly)
+            outlet_key, volume_key, number_key = toc_key_full.rsplit("|", 2)
+            toc_key_variants = [
+                (f"{outlet_key}|{volume_key}|-", ["number"]),
+                (f"{outlet_key}|-|{number_key}", ["volume"]),
+                (f"{outlet_key}|-|-", ["number", "volume"]),
+            ]
+            for toc_key_variant, fields in toc_key_variants:
+                if self.__toc_exists(toc_item=toc_key_variant):
+                    fields_to_remove.extend(fields)
                     return fields_to_remove
 
         return fields_to_remove
 
     def __add_index_toc(self, *, toc_to_index: dict) -> None:
-        list_to_add = list((k, v) for k, v in toc_to_index.items() if v != "DROPPED")
+        # Note : one row per colrev_id (the upsert checks each colrev_id individually)
+        list_to_add = [
+            (toc_key, colrev_id)
+            for toc_key, colrev_ids in toc_to_index.items()
+            if colrev_ids != "DROPPED"
+            for colrev_id in dict.fromkeys(colrev_ids.split(";"))
+        ]
         if not self.sqlite_connection:
             return
         cur = self.sqlite_connection.cursor()
-        try:
-            cur.executemany(f"INSERT INTO {self.TOC_INDEX} VALUES(?, ?)", list_to_add)
-        except sqlite3.IntegrityError as exc:
-            if self.verbose_mode:
-                print(exc)
-        finally:
-            if self.sqlite_connection:
-                self.sqlite_connection.commit()
-
-    def __add_index_records(self, *, recs_to_index: list, curated_fields: list) -> None:
-        list_to_add = [
-            {k: v for k, v in el.items() if k in self.RECORDS_INDEX_KEYS}
-            for el in recs_to_index
-        ]
+        cur.executemany(self.UPSERT_TOC_QUERY, list_to_add)
+        self.sqlite_connection.commit()
 
+    def __add_index_records(
+        self, *, recs_to_index: typing.Iterable[dict], curated_fields: list
+    ) -> None:
         if not self.sqlite_connection:
             return
-        cur = self.sqlite_connection.cursor()
-        for item in list_to_add:
+        # Note : recs_to_index may be a generator that retrieves items from the index,
+        # which replaces self.sqlite_connection (the inserts must be committed
+        # on the connection of the cursor)
+        connection = self.sqlite_connection
+        cur = connection.cursor()
+        for record_dict in recs_to_index:
+            item = {
+                k: v for k, v in record_dict.items() if k in self.RECORDS_INDEX_KEYS
+            }
             while True:
                 for records_index_required_key in self.RECORDS_INDEX_KEYS:
                     if records_index_required_key not in item:
@@ -369,8 +447,7 @@ class LocalIndex:
                     except colrev_exceptions.RecordNotInIndexException:
                         break
 
-        if self.sqlite_connection:
-            self.sqlite_connection.commit()
+        connection.commit()
 
     def __get_record_from_row(self, *, row: dict) -> dict:
         parser = bibtex.Parser()
@@ -408,6 +485,52 @@ class LocalIndex:
 
         raise colrev_exceptions.RecordNotInIndexException()
 
+    def __retrieve_many_based_on_colrev_id(self, *, cids_to_retrieve: list) -> dict:
+        # Note : retrieves the records in one query per batch
+        # (instead of one query per colrev_id). Returns a dict keyed by colrev_id.
+        retrieved_records: typing.Dict[str, dict] = {}
+        cids_to_retrieve = list(dict.fromkeys(cids_to_retrieve))
+        for i in range(0, len(cids_to_retrieve), self.MAX_QUERY_VARIABLES):
+            batch = cids_to_retrieve[i : i + self.MAX_QUERY_VARIABLES]
+            rows = self.__get_items_from_index(
+                index_name=self.RECORD_INDEX,
+                query=(f"colrev_id IN ({','.join('?' * len(batch))})", batch),
+            )
+            for row in rows:
+                retrieved_record = self.__get_record_from_row(row=row)
+                try:
+                    colrev_id = colrev.record.Record(
+                        data=retrieved_record
+                    ).create_colrev_id()
+                except colrev_exceptions.NotEnoughDataToIdentifyException:
+                    continue
+                # Same condition as in __get_item_from_index()
+                if colrev_id in batch:
+                    retrieved_records[colrev_id] = retrieved_record
+        return retrieved_records
+
+    def __retrieve_duplicate_candidates(self, *, cids_to_retrieve: list) -> list:
+        # Note : is_duplicate() is called for many pairs of records
+        # (the same records are retrieved repeatedly and must not be modified)
+        # Records that are not cached yet are retrieved together.
+        cache_keys = [tuple(cids) for cids in cids_to_retrieve]
+        missing_keys = [k for k in cache_keys if k not in self.__duplicate_candidates]
+        if missing_keys:
+            missing_cids = [cid for cache_key in missing_keys for cid in cache_key]
+            retrieved_records = self.__retrieve_many_based_on_colrev_id(
+                cids_to_retrieve=missing_cids
+            )
+            for cache_key in missing_keys:
+                # The first colrev_id that is in the index determines the record
+                found = [
+                    retrieved_records[c] for c in cache_key if c in retrieved_records
+                ]
+                self.__duplicate_candidates[cache_key] = found[0] if found else None
+        candidates = [self.__duplicate_candidates[k] for k in cache_keys]
+        if any(candidate is None for candidate in candidates):
+            raise colrev_exceptions.RecordNotInIndexException()
+        return candidates
+
     def _retrieve_from_github_curation(
         self, *, record_dict: dict
     ) -> dict:  # pragma: no cover
@@ -480,19 +603,10 @@ class LocalIndex:
         fulltext_backup = record_dict.get("fulltext", "NA")
 
         keys_to_remove = (
-            "colrev_origin",
-            "fulltext",
-            "tei_file",
-            "grobid-version",
-            "excl_criteria",
-            "exclusion_criteria",
-            "screening_criteria",
-            "local_curated_metadata",
-            "metadata_source_repository_paths",
+            self.RETURN_DROP_KEYS if include_file else self.RETURN_DROP_KEYS_NO_FILE
         )
-
-        for key in keys_to_remove:
-            record_dict.pop(key, None)
+        for key in keys_to_remove & record_dict.keys():
+            del record_dict[key]
 
         # Note: record['file'] should be an absolute path by definition
         # when stored in the LocalIndex
@@ -506,14 +620,9 @@ class LocalIndex:
             if fulltext_backup != "NA":
                 record_dict["fulltext"] = fulltext_backup
         else:
-            if "file" in record_dict:
-                del record_dict["file"]
-            if "file" in record_dict.get("colrev_data_provenance", {}):
-                del record_dict["colrev_data_provenance"]["file"]
-            if "colrev_pdf_id" in record_dict:
-                del record_dict["colrev_pdf_id"]
-            if "colrev_pdf_id" in record_dict.get("colrev_data_provenance", {}):
-                del record_dict["colrev_data_provenance"]["colrev_pdf_id"]
+            data_provenance = record_dict.get("colrev_data_provenance", {})
+            for key in self.FILE_KEYS & data_provenance.keys():
+                del data_provenance[key]
 
         record = colrev.record.Record(data=record_dict)
         record.set_status(target_state=colrev.record.RecordState.md_prepared)
@@ -601,8 +710,8 @@ class LocalIndex:
                 print(f"Removing deprecated field: {deprecated_field}")
                 del record_dict[deprecated_field]
 
-        if "screening_criteria" in record_dict:
-            del record_dict["screening_criteria"]
+        for key in self.INDEX_DROP_KEYS & record_dict.keys():
+            del record_dict[key]
         # Note: if the colrev_pdf_id has not been checked,
         # we cannot use it for retrieval or preparation.
         post_pdf_prepared_states = colrev.record.RecordState.get_post_x_states(
@@ -612,10 +721,6 @@ class LocalIndex:
             if "colrev_pdf_id" in record_dict:
                 del record_dict["colrev_pdf_id"]
 
-        # Note : numbers of citations change regularly.
-        # They should be retrieved from sources like crossref/doi.org
-        if "cited_by" in record_dict:
-            del record_dict["cited_by"]
         if record_dict.get("year", "NA").isdigit():
             record_dict["year"] = int(record_dict["year"])
         else:
@@ -710,7 +815,7 @@ class LocalIndex:
             cid_to_index = colrev.record.Record(data=record_dict).create_colrev_id()
             record_dict["colrev_id"] = cid_to_index
             record_dict["citation_key"] = record_dict["ID"]
-            record_dict["id"] = self.__get_record_hash(record_dict=record_dict)
+            record_dict["id"] = self.__get_record_hash(colrev_id=cid_to_index)
         except colrev_exceptions.NotEnoughDataToIdentifyException as exc:
             missing_key = ""
             if exc.missing_fields is not None:
@@ -730,7 +835,8 @@ class LocalIndex:
         ]:
             return
 
-        toc_item = colrev.record.Record(data=copy_for_toc_index).get_toc_key()
+        record = colrev.record.Record(data=copy_for_toc_index)
+        toc_item = record.get_toc_key()
         # Note : drop (do not index) tocs where records are missing
         # otherwise, record-not-in-toc will be triggered erroneously.
         drop_toc = copy_for_toc_index[
@@ -739,14 +845,12 @@ class LocalIndex:
             state=colrev.record.RecordState.md_processed
         )
         try:
-            colrev_id = colrev.record.Record(data=copy_for_toc_index).create_colrev_id(
-                assume_complete=True
-            )
+            colrev_id = record.create_colrev_id(assume_complete=True)
         except colrev_exceptions.NotEnoughDataToIdentifyException:
             drop_toc = True
         if drop_toc:
             toc_to_index[toc_item] = "DROPPED"
-        elif toc_to_index.get("toc_item", "") != "DROPPED":
+        elif toc_to_index.get(toc_item, "") != "DROPPED":
             if toc_item in toc_to_index:
                 toc_to_index[toc_item] += f";{colrev_id}"
             else:
@@ -763,57 +867,76 @@ class LocalIndex:
     ) -> None:
         """Index a CoLRev project"""
 
-        recs_to_index = []
         toc_to_index: typing.Dict[str, str] = {}
-        for record_dict in tqdm(records.values()):
-            copy_for_toc_index = deepcopy(record_dict)
-            try:
-                # Add metadata_source_repository_paths : list of repositories from which
-                # the record was integrated. Important for is_duplicate(...)
-                record_dict.update(
-                    metadata_source_repository_paths=str(repo_source_path)
-                )
-
-                if curated_fields:
-                    for curated_field in curated_fields:
-                        colrev.record.Record(data=record_dict).add_data_provenance(
-                            key=curated_field, source=f"CURATED:{curation_url}"
-                        )
-                if curated_masterdata:
+        # Note : indexed records may change the duplicate candidates and tocs
+        self.__duplicate_candidates.clear()
+        self.__toc_items.clear()
+        self.__toc_years.clear()
+
+        def get_records_to_index() -> typing.Iterator[dict]:
+            # Note : records are prepared and yielded one at a time
+            # (without intermediate lists of prepared records)
+            for record_dict in tqdm(records.values()):
+                index_record: typing.Optional[dict] = None
+                copy_for_toc_index = deepcopy(record_dict)
+                try:
+                    # Add metadata_source_repository_paths : list of repositories
+                    # from which the record was integrated. Important for is_duplicate(...)
                     record_dict.update(
-                        colrev_masterdata_provenance=f"CURATED:{curation_url};;"
+                        metadata_source_repository_paths=str(repo_source_path)
                     )
 
-                # Set absolute file paths and set bibtex field (for simpler retrieval)
-                if "file" in record_dict:
-                    record_dict.update(
-                        file=repo_source_path / Path(record_dict["file"])
+                    if curated_fields:
+                        record = colrev.record.Record(data=record_dict)
+                        for curated_field in curated_fields:
+                            record.add_data_provenance(
+                                key=curated_field, source=f"CURATED:{curation_url}"
+                            )
+                    if curated_masterdata:
+                        record_dict.update(
+                            colrev_masterdata_provenance=f"CURATED:{curation_url};;"
+                        )
+
+                    # Set absolute file paths and set bibtex field
+                    # (for simpler retrieval)
+                    if "file" in record_dict:
+                        record_dict.update(
+                            file=repo_source_path / Path(record_dict["file"])
+                        )
+                    record_dict["bibtex"] = colrev.dataset.Dataset.parse_bibtex_str(
+                        recs_dict_in={record_dict["ID"]: record_dict}
                     )
-                record_dict["bibtex"] = colrev.dataset.Dataset.parse_bibtex_str(
-                    recs_dict_in={record_dict["ID"]: record_dict}
-                )
-                record_dict = self.__get_index_record(record_dict=record_dict)
-                recs_to_index.append(record_dict)
+                    index_record = self.__get_index_record(record_dict=record_dict)
+                    self.__index_tei_document(record_dict=index_record)
+
+                except (
+                    colrev_exceptions.RecordNotIndexableException,
+                    colrev_exceptions.NotTOCIdentifiableException,
+                    colrev_exceptions.NotEnoughDataToIdentifyException,
+                ) as exc:
+                    if self.verbose_mode:
+                        print(exc)
+                        print(record_dict)
+                finally:
+                    self.__update_toc_index(
+                        toc_to_index=toc_to_index,
+                        copy_for_toc_index=copy_for_toc_index,
+                        curated_masterdata=curated_masterdata,
+                    )
+                if index_record is not None:
+                    yield index_record
+
+        recs_to_index: typing.Iterable[dict] = get_records_to_index()
+        if self.__index_tei:
+            # Note : create the TEIs (GROBID) before the sqlite transaction starts
+            recs_to_index = list(recs_to_index)
 
-            except (
-                colrev_exceptions.RecordNotIndexableException,
-                colrev_exceptions.NotTOCIdentifiableException,
-                colrev_exceptions.NotEnoughDataToIdentifyException,
-            ) as exc:
-                if self.verbose_mode:
-                    print(exc)
-                    print(record_dict)
-            finally:
-                self.__update_toc_index(
-                    toc_to_index=toc_to_index,
-                    copy_for_toc_index=copy_for_toc_index,
-                    curated_masterdata=curated_masterdata,
-                )
         # Select fields and insert into index (sqlite)
-        self.__index_tei_document(recs_to_index=recs_to_index)
         self.__add_index_records(
             recs_to_index=recs_to_index, curated_fields=curated_fields
         )
+        # Note : toc_to_index is filled while recs_to_index is consumed
+        # (i.e., __add_index_toc must be called after __add_index_records)
         if curated_masterdata:
             self.__add_index_toc(toc_to_index=toc_to_index)
 
@@ -837,6 +960,9 @@ class LocalIndex:
         """Reinitialize the SQLITE database ()"""
         print(f"Reinitialize {self.RECORD_INDEX} and {self.TOC_INDEX}")
         # Note : the tei-directory should be removed manually.
+        self.__duplicate_candidates.clear()
+        self.__toc_items.clear()
+        self.__toc_years.clear()
 
         cur = self.__get_sqlite_cursor(init=True)
         cur.execute(f"drop table if exists {self.RECORD_INDEX}")
@@ -925,14 +1051,8 @@ class LocalIndex:
         import colrev.review_manager
 
         # Note : this task takes long and does not need to run often
-        session = requests_cache.CachedSession(
-            str(colrev.env.environment_manager.EnvironmentManager.cache_path),
-            backend="sqlite",
-            expire_after=timedelta(days=30),
-        )
-        # Note : lambda is necessary to prevent immediate function call
-        # pylint: disable=unnecessary-lambda
-        Timer(0.1, lambda: session.remove_expired_responses()).start()
+        session = colrev.review_manager.ReviewManager.get_cached_session()
+        session.cache.delete(expired=True)
 
         if self.__outlets_duplicated():
             return
@@ -966,18 +1086,28 @@ class LocalIndex:
         #     annotate(self)
         # Note : es.update can use functions applied to each record (for the update)
 
-    def get_year_from_toc(self, *, record_dict: dict) -> str:
-        """Determine the year of a paper based on its table-of-content (journal-volume-number)"""
-
-        try:
-            toc_key = colrev.record.Record(data=record_dict).get_toc_key()
+    def __get_toc_items(self, *, toc_key: str) -> list:
+        if toc_key not in self.__toc_items:
             toc_items = []
-            if self.__toc_exists(toc_item=toc_key):
+            try:
                 res = self.__get_item_from_index(
                     index_name=self.TOC_INDEX, key="toc_key", value=toc_key
                 )
                 toc_items = res.get("colrev_ids", "").split(";")  # type: ignore
+            except colrev_exceptions.RecordNotInIndexException:
+                pass
+            self.__toc_items[toc_key] = toc_items
+        return self.__toc_items[toc_key]
 
+    def get_year_from_toc(self, *, record_dict: dict) -> str:
+        """Determine the year of a paper based on its table-of-content (journal-volume-number)"""
+
+        try:
+            toc_key = colrev.record.Record(data=record_dict).get_toc_key()
+            if toc_key in self.__toc_years:
+                return self.__toc_years[toc_key]
+
+            toc_items = self.__get_toc_items(toc_key=toc_key)
             if not toc_items:
                 raise colrev_exceptions.TOCNotAvailableException()
 
@@ -990,6 +1120,7 @@ class LocalIndex:
             )
 
             year = record_dict.get("year", "NA")
+            self.__toc_years[toc_key] = year
 
             return year
 
@@ -1020,16 +1151,9 @@ class LocalIndex:
     def __get_toc_items_for_toc_retrieval(
         self, *, toc_key: str, search_across_tocs: bool
     ) -> list:
-        toc_items = []
-
-        if self.__toc_exists(toc_item=toc_key):
-            res = self.__get_item_from_index(
-                index_name=self.TOC_INDEX, key="toc_key", value=toc_key
-            )
-            toc_items = res.get("colrev_ids", "").split(";")  # type: ignore
-        else:
-            if not search_across_tocs:
-                raise colrev_exceptions.RecordNotInIndexException()
+        toc_items = self.__get_toc_items(toc_key=toc_key)
+        if not toc_items and not search_across_tocs:
+            raise colrev_exceptions.RecordNotInIndexException()
 
         if not toc_items and search_across_tocs:
             try:
@@ -1065,7 +1189,8 @@ class LocalIndex:
             # Note: in NotTOCIdentifiableException cases, we still need a toc_key.
             # to accomplish this, the get_toc_key() may acced an "accept_incomplete" flag
             # try:
-            toc_key = colrev.record.Record(data=record_dict).get_toc_key()
+            record = colrev.record.Record(data=record_dict)
+            toc_key = record.get_toc_key()
             # except colrev_exceptions.NotTOCIdentifiableException as exc:
             #     if not search_across_tocs:
             #         raise colrev_exceptions.RecordNotInIndexException() from exc
@@ -1074,41 +1199,40 @@ class LocalIndex:
                 toc_key=toc_key, search_across_tocs=search_across_tocs
             )
 
-            if search_across_tocs:
-                record_colrev_id = colrev.record.Record(
-                    data=record_dict
-                ).create_colrev_id(assume_complete=True)
+            record_colrev_id = record.create_colrev_id(
+                assume_complete=search_across_tocs
+            )
 
+            # Note : using a simpler similarity measure
+            # because the publication outlet parameters are already identical
+            # Note : duplicate colrev_ids (across tocs) would reduce the margin to zero
+            toc_items = list(dict.fromkeys(toc_items))
+            # Note : scores are rounded (like thefuzz) before they are compared
+            if search_across_tocs:
+                best_matches = process.extract(
+                    record_colrev_id, toc_items, scorer=fuzz.ratio, limit=2
+                )
             else:
-                record_colrev_id = colrev.record.Record(
-                    data=record_dict
-                ).create_colrev_id()
-
-            sim_list = []
-
-            for toc_records_colrev_id in toc_items:
-                # Note : using a simpler similarity measure
-                # because the publication outlet parameters are already identical
-                sim_value = fuzz.ratio(record_colrev_id, toc_records_colrev_id) / 100
-                sim_list.append(sim_value)
-
-            if not sim_list:
-                raise colrev_exceptions.RecordNotInTOCException(
-                    record_id=record_dict["ID"], toc_key=toc_key
+                best_match = process.extractOne(
+                    record_colrev_id,
+                    toc_items,
+                    scorer=fuzz.ratio,
+                    score_cutoff=similarity_threshold * 100 - 0.5,
                 )
+                best_matches = [best_match] if best_match else []
+            scores = [round(score) for _, score, _ in best_matches]
 
-            if max(sim_list) < similarity_threshold:
+            if not scores or scores[0] / 100 < similarity_threshold:
                 raise colrev_exceptions.RecordNotInTOCException(
                     record_id=record_dict["ID"], toc_key=toc_key
                 )
 
-            if search_across_tocs:
-                second_highest = list(set(sim_list))[-2]
+            if search_across_tocs and len(scores) > 1:
                 # Require a minimum difference to the next most similar record
-                if (max(sim_list) - second_highest) < 0.2:
+                if (scores[0] - scores[1]) / 100 < 0.2:
                     raise colrev_exceptions.RecordNotInIndexException()
 
-            toc_records_colrev_id = toc_items[sim_list.index(max(sim_list))]
+            toc_records_colrev_id = best_matches[0][0]
 
             record_dict = self.__get_item_from_index(
                 index_name=self.RECORD_INDEX,
@@ -1207,6 +1331,67 @@ class LocalIndex:
             del record_to_import["file"]
         return record_to_import
 
+    def __get_global_id_candidates(self, *, global_ids: dict) -> list:
+        # Note : one query with (at most) one row per global id
+        # (common values, such as urls, should not return all matching rows)
+        select_query = " UNION ALL ".join(
+            f"SELECT * FROM (SELECT '{key}' AS global_key, {self.RECORD_COLUMNS} "
+            f"FROM {self.RECORD_INDEX} WHERE {key}=? LIMIT 1)"
+            for key in global_ids
+        )
+        try:
+            self.thread_lock.acquire(timeout=60)
+            cur = self.__get_sqlite_cursor()
+            cur.execute(select_query, list(global_ids.values()))
+            rows = cur.fetchall()
+            self.thread_lock.release()
+        except sqlite3.OperationalError as exc:
+            self.thread_lock.release()
+            raise colrev_exceptions.RecordNotInIndexException() from exc
+
+        # Note : keep the order of the global ids in the record
+        rows.sort(key=lambda row: list(global_ids).index(row["global_key"]))
+        return [
+            (row["global_key"], self.__get_record_from_row(row=row)) for row in rows
+        ]
+
+    def __retrieve_based_on_global_ids(self, *, record_dict: dict) -> dict:
+        global_ids = {
+            k: v
+            for k, v in record_dict.items()
+            if k in self.global_keys and k in self.RECORDS_INDEX_KEYS
+        }
+        if not global_ids:
+            return {}
+
+        try:
+            candidates = self.__get_global_id_candidates(global_ids=global_ids)
+        except colrev_exceptions.RecordNotInIndexException:
+            # Fall back to individual queries (skipping keys that fail)
+            candidates = []
+            for key, value in global_ids.items():
+                try:
+                    candidate = self.__get_item_from_index(
+                        index_name=self.RECORD_INDEX, key=key, value=value
+                    )
+                    candidates.append((key, candidate))
+                except colrev_exceptions.RecordNotInIndexException:
+                    continue
+
+        for key, candidate in candidates:
+            if key == "colrev_id":
+                try:
+                    candidate_value = colrev.record.Record(
+                        data=candidate
+                    ).create_colrev_id()
+                except colrev_exceptions.NotEnoughDataToIdentifyException:
+                    continue
+            else:
+                candidate_value = candidate.get(key, "")
+            if candidate_value == global_ids[key]:
+                return candidate
+        return {}
+
     def retrieve(
         self,
         *,
@@ -1247,17 +1432,9 @@ class LocalIndex:
                     remove_colrev_id = True
                 except colrev_exceptions.NotEnoughDataToIdentifyException:
                     pass
-            for key, value in record_dict.items():
-                if key not in self.global_keys or "ID" == key:
-                    continue
-
-                retrieved_record_dict = self.__get_item_from_index(
-                    index_name=self.RECORD_INDEX, key=key, value=value
-                )
-                if key in retrieved_record_dict:
-                    if retrieved_record_dict[key] == value:
-                        break
-                retrieved_record_dict = {}
+            retrieved_record_dict = self.__retrieve_based_on_global_ids(
+                record_dict=record_dict
+            )
             if remove_colrev_id:
                 del record_dict["colrev_id"]
 
@@ -1293,7 +1470,7 @@ class LocalIndex:
 
             # Easy case: the initial colrev_ids overlap => duplicate
             initial_colrev_ids_overlap = not set(record1_colrev_id).isdisjoint(
-                list(record2_colrev_id)
+                record2_colrev_id
             )
             if initial_colrev_ids_overlap:
                 return "yes"
@@ -1301,11 +1478,8 @@ class LocalIndex:
             # Retrieve records from LocalIndex and use that information
             # to decide whether the records are duplicates
 
-            r1_index = self.__retrieve_based_on_colrev_id(
-                cids_to_retrieve=record1_colrev_id
-            )
-            r2_index = self.__retrieve_based_on_colrev_id(
-                cids_to_retrieve=record2_colrev_id
+            r1_index, r2_index = self.__retrieve_duplicate_candidates(
+                cids_to_retrieve=[record1_colrev_id, record2_colrev_id]
             )
             # Each record may originate from multiple repositories simultaneously
             # see integration of records in __amend_record(...)
@@ -1327,20 +1501,19 @@ class LocalIndex:
             # This does not change if records are also in non-overlapping repositories
 
             same_repository = not set(r1_metadata_source_repository_paths).isdisjoint(
-                set(r2_metadata_source_repository_paths)
-            )
-
-            # colrev_ids must be used instead of IDs
-            # because IDs of original repositories
-            # are not available in the integrated record
-
-            colrev_ids_overlap = not set(
-                colrev.record.Record(data=r1_index).get_colrev_id()
-            ).isdisjoint(
-                list(list(colrev.record.Record(data=r2_index).get_colrev_id()))
+                r2_metadata_source_repository_paths
             )
 
             if same_repository:
+                # colrev_ids must be used instead of IDs
+                # because IDs of original repositories
+                # are not available in the integrated record
+                # Note : the colrev_ids are only needed for the same repository
+                colrev_ids_overlap = not set(
+                    colrev.record.Record.get_colrev_id_from_dict(data=r1_index)
+                ).isdisjoint(
+                    colrev.record.Record.get_colrev_id_from_dict(data=r2_index)
+                )
                 if colrev_ids_overlap:
                     return "yes"
                 return "no"
@@ -1349,13 +1522,12 @@ class LocalIndex:
             # i.e., there are no duplicates between curated repositories.
             # see __outlets_duplicated(...)
 
+            r1_masterdata_provenance = r1_index.get("colrev_masterdata_provenance", "")
+            r2_masterdata_provenance = r2_index.get("colrev_masterdata_provenance", "")
             different_curated_repositories = (
-                "CURATED" in r1_index.get("colrev_masterdata_provenance", "")
-                and "CURATED" in r2_index.get("colrev_masterdata_provenance", "")
-                and (
-                    r1_index.get("colrev_masterdata_provenance", "a")
-                    != r2_index.get("colrev_masterdata_provenance", "b")
-                )
+                "CURATED" in r1_masterdata_provenance
+                and "CURATED" in r2_masterdata_provenance
+                and r1_masterdata_provenance != r2_masterdata_provenance
             )
 
             if different_curated_repositories:
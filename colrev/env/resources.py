@@ -27,11 +27,12 @@ class Resources:
 
         # check if url else return False
         # validators.url(curated_resource)
-        if "http" not in curated_resource:
+        if not curated_resource.startswith(("http://", "https://")):
             curated_resource = "https://github.com/" + curated_resource
         self.curations_path.mkdir(exist_ok=True, parents=True)
-        repo_dir = self.curations_path / Path(curated_resource.split("/")[-1])
-        annotator_dir = self.annotators_path / Path(curated_resource.split("/")[-1])
+        repo_name = curated_resource.rsplit("/", 1)[-1]
+        repo_dir = self.curations_path / Path(repo_name)
+        annotator_dir = self.annotators_path / Path(repo_name)
         if repo_dir.is_dir():
             print(f"Repo already exists ({repo_dir})")
             return False
@@ -25,6 +25,7 @@ class ScreenshotService:
         self.review_manager.environment_manager.build_docker_image(
             imagename=self.chrome_browserless_image
         )
+        self.session = requests.Session()
 
     def start_screenshot_service(self) -> None:
         """Start the screenshot service"""
@@ -54,12 +55,14 @@ class ScreenshotService:
                 f"Docker service not available ({exc}). Please install/start Docker."
             ) from exc
 
-        i = 0
-        while i < 45:
+        # Note : poll with an exponential backoff (the service often starts quickly)
+        delay = 0.1
+        start_time = time.monotonic()
+        while time.monotonic() - start_time < 45:
             if self.screenshot_service_available():
                 break
-            time.sleep(1)
-            i += 1
+            time.sleep(delay)
+            delay = min(delay * 1.5, 2.0)
         return
 
     def screenshot_service_available(self) -> bool:
@@ -69,7 +72,7 @@ class ScreenshotService:
 
         browserless_chrome_available = False
         try:
-            ret = requests.get(
+            ret = self.session.get(
                 "http://127.0.0.1:3000/",
                 headers=content_type_header,
                 timeout=30,
@@ -102,7 +105,7 @@ class ScreenshotService:
             },
         }
 
-        ret = requests.post("http://127.0.0.1:3000/pdf", json=json_val, timeout=30)
+        ret = self.session.post("http://127.0.0.1:3000/pdf", json=json_val, timeout=30)
 
         if 200 == ret.status_code:
             with open(pdf_filepath, "wb") as file:
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from xml import etree
@@ -12,6 +14,8 @@ import defusedxml
 import requests
 from defusedxml.ElementTree import fromstring
 from lxml.etree import XMLSyntaxError  # nosec
+from rapidfuzz import fuzz
+from rapidfuzz import process
 
 import colrev.env.grobid_service
 import colrev.exceptions as colrev_exceptions
@@ -33,6 +37,17 @@ defusedxml.defuse_stdlib()
 class TEIParser:
     """Environment service for TEI parsing"""
 
+    # Note : instance attributes are stored in slots (no instance __dict__)
+    __slots__ = (
+        "environment_manager",
+        "pdf_path",
+        "tei_path",
+        "root",
+        "__metadata",
+        "__abstract",
+        "__paper_keywords",
+    )
+
     ns = {
         "tei": "{http://www.tei-c.org/ns/1.0}",
         "w3": "{http://www.w3.org/XML/1998/namespace}",
@@ -42,6 +57,97 @@ class TEIParser:
         "w3": "http://www.w3.org/XML/1998/namespace",
     }
 
+    # Note : paths are created once
+    # (ElementTree caches the compiled paths, keyed by the path string)
+    ENCODING_DESC_PATH = f".//{ns['tei']}encodingDesc"
+    APP_INFO_PATH = f".//{ns['tei']}appInfo"
+    APPLICATION_PATH = f".//{ns['tei']}application"
+    FILE_DESC_PATH = f".//{ns['tei']}fileDesc"
+    TITLE_STMT_PATH = f".//{ns['tei']}titleStmt"
+    TITLE_PATH = f".//{ns['tei']}title"
+    SOURCE_DESC_PATH = f".//{ns['tei']}sourceDesc"
+    BIBL_STRUCT_PATH = f".//{ns['tei']}biblStruct"
+    ANALYTIC_PATH = f".//{ns['tei']}analytic"
+    MONOGR_PATH = f".//{ns['tei']}monogr"
+    IMPRINT_PATH = f".//{ns['tei']}imprint"
+    VOLUME_PATH = f".//{ns['tei']}biblScope[@unit='volume']"
+    ISSUE_PATH = f".//{ns['tei']}biblScope[@unit='issue']"
+    PAGE_PATH = f".//{ns['tei']}biblScope[@unit='page']"
+    DATE_PATH = f".//{ns['tei']}date"
+    DOI_PATH = f".//{ns['tei']}idno[@type='DOI']"
+    PROFILE_DESC_PATH = f".//{ns['tei']}profileDesc"
+    ABSTRACT_PATH = f".//{ns['tei']}abstract"
+    LIST_BIBL_PATH = f".//{ns['tei']}listBibl"
+
+    # Note : tags (and paths) of direct children are also created once
+    ANALYTIC_TAG = f"{ns['tei']}analytic"
+    MONOGR_TAG = f"{ns['tei']}monogr"
+    IMPRINT_TAG = f"{ns['tei']}imprint"
+    TITLE_TAG = f"{ns['tei']}title"
+    DATE_TAG = f"{ns['tei']}date"
+    AUTHOR_TAG = f"{ns['tei']}author"
+    PERS_NAME_TAG = f"{ns['tei']}persName"
+    SURNAME_TAG = f"{ns['tei']}surname"
+    FORENAME_TAG = f"{ns['tei']}forename"
+    EMAIL_TAG = f"{ns['tei']}email"
+    IDNO_TAG = f"{ns['tei']}idno"
+    KEYWORDS_TAG = f"{ns['tei']}keywords"
+    TERM_TAG = f"{ns['tei']}term"
+    LIST_BIBL_TAG = f"{ns['tei']}listBibl"
+    REF_TAG = f"{ns['tei']}ref"
+    HEAD_TAG = f"{ns['tei']}head"
+    BIBL_SCOPE_TAG = f"{ns['tei']}biblScope"
+    W3_ID_ATTRIBUTE = f"{ns['w3']}id"
+
+    # Note : author strings are sanitized in one pass (instead of chained replace())
+    AUTHOR_SUBSTITUTIONS = {
+        "\n": " ",
+        "\r": "",
+        "•": "",
+        "+": "",
+        "Dipl.": "",
+        "Prof.": "",
+        "Dr.": "",
+        "&apos": "'",
+        "❚": "",
+        "~": "",
+        "®": "",
+        "|": "",
+    }
+    AUTHOR_SUBSTITUTIONS_REGEX = re.compile(
+        "|".join(re.escape(key) for key in AUTHOR_SUBSTITUTIONS)
+    )
+
+    # Records that are considered in mark_references()
+    MARK_REFERENCES_STATES = frozenset(
+        {
+            colrev.record.RecordState.rev_included,
+            colrev.record.RecordState.rev_synthesized,
+        }
+    )
+
+    # Note : get_record_similarity() weights the title similarity with 0.25
+    # (or 0 for common titles, which must be identical in that case).
+    # Pairs with a title ratio below 60 cannot exceed the 0.9 threshold
+    MARK_REFERENCES_TITLE_CUTOFF = 60
+
+    # Note : the fields that are considered in get_record_similarity()
+    SIMILARITY_FIELDS = (
+        "title",
+        "author",
+        "year",
+        "journal",
+        "volume",
+        "number",
+        "pages",
+        "booktitle",
+        "series",
+        "container_title",
+    )
+
+    SHORT_PAPER_REGEX = re.compile("^Paper, Short; ")
+    YEAR_REGEX = re.compile(r".*([1-2][0-9]{3}).*")
+
     def __init__(
         self,
         *,
@@ -57,6 +163,10 @@ class TEIParser:
         """
 
         self.environment_manager = environment_manager
+        # Note : the results are cached (copies are returned)
+        self.__metadata: Optional[dict] = None
+        self.__abstract: Optional[str] = None
+        self.__paper_keywords: Optional[list] = None
         # pylint: disable=consider-using-with
         assert pdf_path is not None or tei_path is not None
         if pdf_path is not None:
@@ -80,13 +190,14 @@ class TEIParser:
 
     def __read_from_tei(self):  # type: ignore
         """Read a TEI from file"""
+        # Note : the file is parsed incrementally by the (defused) parser
+        # instead of reading the complete content into memory first.
+        # The tree is kept (not cleared) because it is modified in mark_references()
         with open(self.tei_path, "rb") as data:
-            xslt_content = data.read()
-
-        if b"[BAD_INPUT_DATA]" in xslt_content[:100]:
-            raise colrev_exceptions.TEIException()
-
-        return etree.ElementTree.XML(xslt_content)
+            if b"[BAD_INPUT_DATA]" in data.read(100):
+                raise colrev_exceptions.TEIException()
+            data.seek(0)
+            return etree.ElementTree.parse(data).getroot()
 
     def __create_tei(self) -> None:
         """Create the TEI (based on GROBID)"""
@@ -105,13 +216,15 @@ class TEIParser:
         # But parsing the metadata from the tei gives us more control of the details
 
         try:
-            # pylint: disable=consider-using-with
-            ret = requests.post(
-                grobid_service.GROBID_URL + "/api/processFulltextDocument",
-                files={"input": open(str(self.pdf_path), "rb")},
-                data=options,
-                timeout=180,
-            )
+            # Note : the file is closed after the upload
+            # (instead of leaving the handle open until garbage collection)
+            with open(str(self.pdf_path), "rb") as pdf_file:
+                ret = grobid_service.session.post(
+                    grobid_service.GROBID_URL + "/api/processFulltextDocument",
+                    files={"input": pdf_file},
+                    data=options,
+                    timeout=180,
+                )
 
             # Possible extension: get header only (should be more efficient)
             # r = requests.post(
@@ -130,14 +243,8 @@ class TEIParser:
 
             if self.tei_path is not None:
                 self.tei_path.parent.mkdir(exist_ok=True, parents=True)
-                with open(self.tei_path, "wb") as file:
-                    file.write(ret.content)
-
-                # Note : reopen/write to prevent format changes in the enhancement
-                with open(self.tei_path, "rb") as file:
-                    xml_fstring = file.read()
-                self.root = fromstring(xml_fstring)
-
+                # Note : write the parsed tree (not the response content)
+                # to prevent format changes in the enhancement
                 tree = etree.ElementTree.ElementTree(self.root)
                 tree.write(str(self.tei_path), encoding="utf-8")
         except requests.exceptions.ConnectionError as exc:
@@ -155,29 +262,22 @@ class TEIParser:
     def get_grobid_version(self) -> str:
         """Get the GROBID version used for TEI creation"""
         grobid_version = "NA"
-        encoding_description = self.root.find(".//" + self.ns["tei"] + "encodingDesc")
+        encoding_description = self.root.find(self.ENCODING_DESC_PATH)
         if encoding_description is not None:
-            app_info_node = encoding_description.find(
-                ".//" + self.ns["tei"] + "appInfo"
-            )
+            app_info_node = encoding_description.find(self.APP_INFO_PATH)
             if app_info_node is not None:
-                application_node = encoding_description.find(
-                    ".//" + self.ns["tei"] + "application"
-                )
+                application_node = encoding_description.find(self.APPLICATION_PATH)
                 if application_node is not None:
-                    if application_node.get("version") is not None:
-                        grobid_version = application_node.get("version")
+                    grobid_version = application_node.get("version", "NA")
         return grobid_version
 
     def __get_paper_title(self) -> str:
         title_text = "NA"
-        file_description = self.root.find(".//" + self.ns["tei"] + "fileDesc")
+        file_description = self.root.find(self.FILE_DESC_PATH)
         if file_description is not None:
-            title_stmt_node = file_description.find(
-                ".//" + self.ns["tei"] + "titleStmt"
-            )
+            title_stmt_node = file_description.find(self.TITLE_STMT_PATH)
             if title_stmt_node is not None:
-                title_node = title_stmt_node.find(".//" + self.ns["tei"] + "title")
+                title_node = title_stmt_node.find(self.TITLE_PATH)
                 if title_node is not None:
                     title_text = (
                         title_node.text if title_node.text is not None else "NA"
@@ -190,113 +290,83 @@ class TEIParser:
                     )
         return title_text
 
-    def __get_paper_journal(self) -> str:
-        # pylint: disable=too-many-nested-blocks
+    def __get_paper_journal(self, *, monogr_node: Optional[Element]) -> str:
         journal_name = "NA"
-        file_description = self.root.find(".//" + self.ns["tei"] + "sourceDesc")
-        if file_description is not None:
-            if file_description.find(".//" + self.ns["tei"] + "monogr") is not None:
-                journal_node = file_description.find(".//" + self.ns["tei"] + "monogr")
-                if journal_node is not None:
-                    jtitle_node = journal_node.find(".//" + self.ns["tei"] + "title")
-                    if jtitle_node is not None:
-                        journal_name = (
-                            jtitle_node.text if jtitle_node.text is not None else "NA"
-                        )
-                        if journal_name != "NA":
-                            words = journal_name.split()
-                            if sum(word.isupper() for word in words) / len(words) > 0.8:
-                                words = [word.capitalize() for word in words]
-                                journal_name = " ".join(words)
+        if monogr_node is not None:
+            jtitle_node = monogr_node.find(self.TITLE_PATH)
+            if jtitle_node is not None:
+                journal_name = (
+                    jtitle_node.text if jtitle_node.text is not None else "NA"
+                )
+                if journal_name != "NA":
+                    words = journal_name.split()
+                    if sum(word.isupper() for word in words) / len(words) > 0.8:
+                        words = [word.capitalize() for word in words]
+                        journal_name = " ".join(words)
         return journal_name
 
-    def __get_paper_journal_volume(self) -> str:
+    def __get_paper_journal_volume(self, *, imprint_node: Optional[Element]) -> str:
         volume = "NA"
-        file_description = self.root.find(".//" + self.ns["tei"] + "sourceDesc")
-        if file_description is not None:
-            if file_description.find(".//" + self.ns["tei"] + "monogr") is not None:
-                journal_node = file_description.find(".//" + self.ns["tei"] + "monogr")
-                if journal_node is not None:
-                    imprint_node = journal_node.find(".//" + self.ns["tei"] + "imprint")
-                    if imprint_node is not None:
-                        vnode = imprint_node.find(
-                            ".//" + self.ns["tei"] + "biblScope[@unit='volume']"
-                        )
-                        if vnode is not None:
-                            volume = vnode.text if vnode.text is not None else "NA"
+        if imprint_node is not None:
+            vnode = imprint_node.find(self.VOLUME_PATH)
+            if vnode is not None:
+                volume = vnode.text if vnode.text is not None else "NA"
         return volume
 
-    def __get_paper_journal_issue(self) -> str:
+    def __get_paper_journal_issue(self, *, imprint_node: Optional[Element]) -> str:
         issue = "NA"
-        file_description = self.root.find(".//" + self.ns["tei"] + "sourceDesc")
-        if file_description is not None:
-            if file_description.find(".//" + self.ns["tei"] + "monogr") is not None:
-                journal_node = file_description.find(".//" + self.ns["tei"] + "monogr")
-                if journal_node is not None:
-                    imprint_node = journal_node.find(".//" + self.ns["tei"] + "imprint")
-                    if imprint_node is not None:
-                        issue_node = imprint_node.find(
-                            ".//" + self.ns["tei"] + "biblScope[@unit='issue']"
-                        )
-                        if issue_node is not None:
-                            issue = (
-                                issue_node.text if issue_node.text is not None else "NA"
-                            )
+        if imprint_node is not None:
+            issue_node = imprint_node.find(self.ISSUE_PATH)
+            if issue_node is not None:
+                issue = issue_node.text if issue_node.text is not None else "NA"
         return issue
 
-    def __get_paper_journal_pages(self) -> str:
+    def __get_paper_journal_pages(self, *, imprint_node: Optional[Element]) -> str:
         pages = "NA"
-        file_description = self.root.find(".//" + self.ns["tei"] + "sourceDesc")
-        if file_description is not None:
-            journal_node = file_description.find(".//" + self.ns["tei"] + "monogr")
-            if journal_node is not None:
-                imprint_node = journal_node.find(".//" + self.ns["tei"] + "imprint")
-                if imprint_node is not None:
-                    page_node = imprint_node.find(
-                        ".//" + self.ns["tei"] + "biblScope[@unit='page']"
-                    )
-                    if page_node is not None:
-                        if (
-                            page_node.get("from") is not None
-                            and page_node.get("to") is not None
-                        ):
-                            pages = (
-                                page_node.get("from", "")
-                                + "--"
-                                + page_node.get("to", "")
-                            )
+        if imprint_node is not None:
+            page_node = imprint_node.find(self.PAGE_PATH)
+            if page_node is not None:
+                if (
+                    page_node.get("from") is not None
+                    and page_node.get("to") is not None
+                ):
+                    pages = page_node.get("from", "") + "--" + page_node.get("to", "")
         return pages
 
-    def __get_paper_year(self) -> str:
+    def __get_paper_year(self, *, imprint_node: Optional[Element]) -> str:
         year = "NA"
-        file_description = self.root.find(".//" + self.ns["tei"] + "sourceDesc")
-        if file_description is not None:
-            if file_description.find(".//" + self.ns["tei"] + "monogr") is not None:
-                journal_node = file_description.find(".//" + self.ns["tei"] + "monogr")
-                if journal_node is not None:
-                    imprint_node = journal_node.find(".//" + self.ns["tei"] + "imprint")
-                    if imprint_node is not None:
-                        date_node = imprint_node.find(".//" + self.ns["tei"] + "date")
-                        if date_node is not None:
-                            year = (
-                                date_node.get("when", "")
-                                if date_node.get("when") is not None
-                                else "NA"
-                            )
-                            year = re.sub(r".*([1-2][0-9]{3}).*", r"\1", year)
+        if imprint_node is not None:
+            date_node = imprint_node.find(self.DATE_PATH)
+            if date_node is not None:
+                year = (
+                    date_node.get("when", "")
+                    if date_node.get("when") is not None
+                    else "NA"
+                )
+                year = self.YEAR_REGEX.sub(r"\1", year)
         return year
 
+    def __find_child_by_attribute(
+        self, *, node: Element, tag: str, key: str, value: str
+    ) -> Optional[Element]:
+        # Note : findall(tag) is evaluated in C, paths with predicates
+        # (e.g., "tag[@key='value']") are interpreted by the (Python) ElementPath
+        for child in node.findall(tag):
+            if child.get(key) == value:
+                return child
+        return None
+
     def __parse_author_dict(self, *, author_pers_node: Element) -> dict:
         author_dict = {}
-        surname_node = author_pers_node.find(self.ns["tei"] + "surname")
+        surname_node = author_pers_node.find(self.SURNAME_TAG)
         if surname_node is not None:
             surname = surname_node.text if surname_node.text is not None else ""
             author_dict["surname"] = surname
         else:
             author_dict["surname"] = ""
 
-        forename_node = author_pers_node.find(
-            self.ns["tei"] + 'forename[@type="first"]'
+        forename_node = self.__find_child_by_attribute(
+            node=author_pers_node, tag=self.FORENAME_TAG, key="type", value="first"
         )
         if forename_node is not None:
             forename = forename_node.text if forename_node.text is not None else ""
@@ -306,8 +376,8 @@ class TEIParser:
         else:
             author_dict["forename"] = ""
 
-        middlename_node = author_pers_node.find(
-            self.ns["tei"] + 'forename[@type="middle"]'
+        middlename_node = self.__find_child_by_attribute(
+            node=author_pers_node, tag=self.FORENAME_TAG, key="type", value="middle"
         )
         if middlename_node is not None:
             middlename = (
@@ -321,10 +391,17 @@ class TEIParser:
 
         return author_dict
 
+    def __clean_author_string(self, *, author_string: str) -> str:
+        # Note : strings without matches (most author strings from GROBID)
+        # are returned unchanged (without allocating a new string)
+        return self.AUTHOR_SUBSTITUTIONS_REGEX.sub(
+            lambda match: self.AUTHOR_SUBSTITUTIONS[match.group(0)], author_string
+        )
+
     def __get_author_name_from_node(self, *, author_node: Element) -> str:
         authorname = ""
 
-        author_pers_node = author_node.find(self.ns["tei"] + "persName")
+        author_pers_node = author_node.find(self.PERS_NAME_TAG)
         if author_pers_node is None:
             return authorname
 
@@ -334,63 +411,40 @@ class TEIParser:
         if "middlename" in author_dict:
             authorname += author_dict["middlename"]
 
-        authorname = (
-            authorname.replace("\n", " ")
-            .replace("\r", "")
-            .replace("•", "")
-            .replace("+", "")
-            .replace("Dipl.", "")
-            .replace("Prof.", "")
-            .replace("Dr.", "")
-            .replace("&apos", "'")
-            .replace("❚", "")
-            .replace("~", "")
-            .replace("®", "")
-            .replace("|", "")
-        )
+        authorname = self.__clean_author_string(author_string=authorname)
 
-        authorname = re.sub("^Paper, Short; ", "", authorname)
+        authorname = self.SHORT_PAPER_REGEX.sub("", authorname)
         return authorname
 
-    def __get_paper_authors(self) -> str:
+    def __get_paper_authors(self, *, source_description: Optional[Element]) -> str:
         author_string = "NA"
-        file_description = self.root.find(".//" + self.ns["tei"] + "sourceDesc")
-        author_list = []
 
-        if file_description is not None:
-            if file_description.find(".//" + self.ns["tei"] + "analytic") is not None:
-                analytic_node = file_description.find(
-                    ".//" + self.ns["tei"] + "analytic"
+        if source_description is not None:
+            analytic_node = source_description.find(self.ANALYTIC_PATH)
+            if analytic_node is not None:
+                author_string = " and ".join(
+                    authorname
+                    for authorname in (
+                        self.__get_author_name_from_node(author_node=author_node)
+                        for author_node in analytic_node.findall(self.AUTHOR_TAG)
+                    )
+                    if authorname not in ("Paper, Short", ", ", "")
                 )
-                if analytic_node is not None:
-                    for author_node in analytic_node.iterfind(
-                        self.ns["tei"] + "author"
-                    ):
-                        authorname = self.__get_author_name_from_node(
-                            author_node=author_node
-                        )
-                        if authorname in ["Paper, Short"]:
-                            continue
-                        if authorname not in [", ", ""]:
-                            author_list.append(authorname)
 
-                    author_string = " and ".join(author_list)
-
-                    if author_string is None:
-                        author_string = "NA"
-                    if "" == author_string.replace(" ", "").replace(",", "").replace(
-                        ";", ""
-                    ):
-                        author_string = "NA"
+                if author_string is None:
+                    author_string = "NA"
+                if "" == author_string.replace(" ", "").replace(",", "").replace(
+                    ";", ""
+                ):
+                    author_string = "NA"
         return author_string
 
-    def __get_paper_doi(self) -> str:
+    def __get_paper_doi(self, *, source_description: Optional[Element]) -> str:
         doi = "NA"
-        file_description = self.root.find(".//" + self.ns["tei"] + "sourceDesc")
-        if file_description is not None:
-            bibl_struct = file_description.find(".//" + self.ns["tei"] + "biblStruct")
+        if source_description is not None:
+            bibl_struct = source_description.find(self.BIBL_STRUCT_PATH)
             if bibl_struct is not None:
-                dois = bibl_struct.findall(".//" + self.ns["tei"] + "idno[@type='DOI']")
+                dois = bibl_struct.findall(self.DOI_PATH)
                 for res in dois:
                     if res.text is not None:
                         doi = res.text
@@ -399,36 +453,46 @@ class TEIParser:
     def get_abstract(self) -> str:
         """Get the abstract"""
 
-        html_tag_regex = re.compile("<.*?>")
-
-        def cleanhtml(raw_html: str) -> str:
-            cleantext = re.sub(html_tag_regex, "", raw_html)
-            return cleantext
+        if self.__abstract is not None:
+            return self.__abstract
 
         abstract_text = "NA"
-        profile_description = self.root.find(".//" + self.ns["tei"] + "profileDesc")
+        profile_description = self.root.find(self.PROFILE_DESC_PATH)
         if profile_description is not None:
-            abstract_node = profile_description.find(
-                ".//" + self.ns["tei"] + "abstract"
-            )
-            html_str = etree.ElementTree.tostring(abstract_node).decode("utf-8")
-            abstract_text = cleanhtml(html_str)
+            abstract_node = profile_description.find(self.ABSTRACT_PATH)
+            # Note : the text nodes are joined directly (instead of serializing
+            # the abstract and removing the tags with a regex)
+            if abstract_node is not None:
+                abstract_text = "".join(abstract_node.itertext())
         abstract_text = abstract_text.lstrip().rstrip()
+        self.__abstract = abstract_text
         return abstract_text
 
     def get_metadata(self) -> dict:
         """Get the metadata of the PDF (title, author, ...) as a dict"""
 
+        if self.__metadata is not None:
+            return self.__metadata.copy()
+
+        # Note : the sourceDesc/monogr/imprint nodes are located once
+        # (instead of descending from the root in each getter)
+        source_description = self.root.find(self.SOURCE_DESC_PATH)
+        monogr_node, imprint_node = None, None
+        if source_description is not None:
+            monogr_node = source_description.find(self.MONOGR_PATH)
+            if monogr_node is not None:
+                imprint_node = monogr_node.find(self.IMPRINT_PATH)
+
         record = {
             "ENTRYTYPE": "article",
             "title": self.__get_paper_title(),
-            "author": self.__get_paper_authors(),
-            "journal": self.__get_paper_journal(),
-            "year": self.__get_paper_year(),
-            "volume": self.__get_paper_journal_volume(),
-            "number": self.__get_paper_journal_issue(),
-            "pages": self.__get_paper_journal_pages(),
-            "doi": self.__get_paper_doi(),
+            "author": self.__get_paper_authors(source_description=source_description),
+            "journal": self.__get_paper_journal(monogr_node=monogr_node),
+            "year": self.__get_paper_year(imprint_node=imprint_node),
+            "volume": self.__get_paper_journal_volume(imprint_node=imprint_node),
+            "number": self.__get_paper_journal_issue(imprint_node=imprint_node),
+            "pages": self.__get_paper_journal_pages(imprint_node=imprint_node),
+            "doi": self.__get_paper_doi(source_description=source_description),
         }
 
         for key, value in record.items():
@@ -437,89 +501,72 @@ class TEIParser:
             else:
                 print(f"problem in filename: {key}")
 
-        return record
+        self.__metadata = record
+        return record.copy()
 
     def get_paper_keywords(self) -> list:
         """Get hte keywords"""
-        keywords = []
-        for keyword_list in self.root.iter(self.ns["tei"] + "keywords"):
-            for keyword in keyword_list.iter(self.ns["tei"] + "term"):
-                keywords.append(keyword.text)
-        return keywords
+        if self.__paper_keywords is None:
+            self.__paper_keywords = [
+                keyword.text
+                for keyword_list in self.root.iter(self.KEYWORDS_TAG)
+                for keyword in keyword_list.iter(self.TERM_TAG)
+            ]
+        return self.__paper_keywords.copy()
 
     def get_author_details(self) -> list:
         """Get the author details"""
         author_details = []
 
-        file_description = self.root.find(".//" + self.ns["tei"] + "sourceDesc")
+        file_description = self.root.find(self.SOURCE_DESC_PATH)
 
         if file_description is not None:
-            if file_description.find(".//" + self.ns["tei"] + "analytic") is not None:
-                analytic_node = file_description.find(
-                    ".//" + self.ns["tei"] + "analytic"
-                )
-                if analytic_node is not None:
-                    for author_node in analytic_node.iterfind(
-                        self.ns["tei"] + "author"
-                    ):
-                        author_pers_node = author_node.find(self.ns["tei"] + "persName")
-                        if author_pers_node is None:
-                            continue
+            analytic_node = file_description.find(self.ANALYTIC_PATH)
+            if analytic_node is not None:
+                for author_node in analytic_node.findall(self.AUTHOR_TAG):
+                    author_pers_node = author_node.find(self.PERS_NAME_TAG)
+                    if author_pers_node is None:
+                        continue
 
-                        author_dict = self.__parse_author_dict(
-                            author_pers_node=author_pers_node
-                        )
+                    author_dict = self.__parse_author_dict(
+                        author_pers_node=author_pers_node
+                    )
 
-                        email_node = author_node.find(self.ns["tei"] + "email")
-                        if email_node is not None:
-                            author_dict["emai"] = email_node.text
+                    email_node = author_node.find(self.EMAIL_TAG)
+                    if email_node is not None:
+                        author_dict["emai"] = email_node.text
 
-                        orcid_node = author_node.find(
-                            self.ns["tei"] + 'idno[@type="ORCID"]'
-                        )
-                        if orcid_node is not None:
-                            orcid = orcid_node.text
-                            author_dict["ORCID"] = orcid
+                    orcid_node = self.__find_child_by_attribute(
+                        node=author_node,
+                        tag=self.IDNO_TAG,
+                        key="type",
+                        value="ORCID",
+                    )
+                    if orcid_node is not None:
+                        orcid = orcid_node.text
+                        author_dict["ORCID"] = orcid
 
-                        author_details.append(author_dict)
+                    author_details.append(author_dict)
 
         return author_details
 
     # (individual) bibliography-reference elements  ----------------------------
 
     def __get_reference_bibliography_tei_id(self, *, reference: Element) -> str:
-        return reference.attrib[self.ns["w3"] + "id"]
-
-    def __get_reference_author_string(self, *, reference: Element) -> str:
-        author_list = []
-        if reference.find(self.ns["tei"] + "analytic") is not None:
-            authors_node = reference.find(self.ns["tei"] + "analytic")
-        elif reference.find(self.ns["tei"] + "monogr") is not None:
-            authors_node = reference.find(self.ns["tei"] + "monogr")
-
-        if authors_node is not None:
-            for author_node in authors_node.iterfind(self.ns["tei"] + "author"):
-                authorname = self.__get_author_name_from_node(author_node=author_node)
-
-                if authorname not in [", ", ""]:
-                    author_list.append(authorname)
-
-        author_string = " and ".join(author_list)
-
-        author_string = (
-            author_string.replace("\n", " ")
-            .replace("\r", "")
-            .replace("•", "")
-            .replace("+", "")
-            .replace("Dipl.", "")
-            .replace("Prof.", "")
-            .replace("Dr.", "")
-            .replace("&apos", "'")
-            .replace("❚", "")
-            .replace("~", "")
-            .replace("®", "")
-            .replace("|", "")
-        )
+        return reference.attrib[self.W3_ID_ATTRIBUTE]
+
+    def __get_reference_author_string(self, *, main_node: Optional[Element]) -> str:
+        author_string = ""
+        if main_node is not None:
+            author_string = " and ".join(
+                authorname
+                for authorname in (
+                    self.__get_author_name_from_node(author_node=author_node)
+                    for author_node in main_node.findall(self.AUTHOR_TAG)
+                )
+                if authorname not in (", ", "")
+            )
+        # Note : the author names are sanitized in __get_author_name_from_node()
 
         if author_string is None:
             author_string = "NA"
@@ -527,37 +574,21 @@ class TEIParser:
             author_string = "NA"
         return author_string
 
-    def __get_reference_title_string(self, *, reference: Element) -> str:
+    def __get_reference_title_string(self, *, main_node: Optional[Element]) -> str:
         title_string = ""
-        if reference.find(self.ns["tei"] + "analytic") is not None:
-            analytic_node = reference.find(self.ns["tei"] + "analytic")
-            if analytic_node is not None:
-                title = analytic_node.find(self.ns["tei"] + "title")
-        elif reference.find(self.ns["tei"] + "monogr") is not None:
-            monogr_node = reference.find(self.ns["tei"] + "monogr")
-            if monogr_node is not None:
-                title = monogr_node.find(self.ns["tei"] + "title")
-
-        if title is not None:
-            if title.text is not None:
-                title_string = title.text
+        if main_node is not None:
+            title = main_node.find(self.TITLE_TAG)
+            if title is not None:
+                if title.text is not None:
+                    title_string = title.text
 
         return title_string
 
-    def __get_reference_year_string(self, *, reference: Element) -> str:
+    def __get_reference_year_string(self, *, imprint_node: Optional[Element]) -> str:
         year_string = ""
-        if reference.find(self.ns["tei"] + "monogr") is not None:
-            monogr_node = reference.find(self.ns["tei"] + "monogr")
-            if monogr_node is not None:
-                imprint_node = monogr_node.find(self.ns["tei"] + "imprint")
-                if imprint_node is not None:
-                    year = imprint_node.find(self.ns["tei"] + "date")
-        elif reference.find(self.ns["tei"] + "analytic") is not None:
-            analytic_node = reference.find(self.ns["tei"] + "analytic")
-            if analytic_node is not None:
-                imprint_node = analytic_node.find(self.ns["tei"] + "imprint")
-                if imprint_node is not None:
-                    year = imprint_node.find(self.ns["tei"] + "date")
+        year = None
+        if imprint_node is not None:
+            year = imprint_node.find(self.DATE_TAG)
 
         if year is not None:
             for name, value in sorted(year.items()):
@@ -566,204 +597,131 @@ class TEIParser:
             year_string = "NA"
         return year_string
 
-    def __get_reference_page_string(self, *, reference: Element) -> str:
-        page_string = ""
+    def __get_reference_bibl_scopes(self, *, imprint_node: Optional[Element]) -> dict:
+        # Note : collect the biblScope nodes in one pass, grouped by their unit
+        bibl_scopes: dict = {}
+        if imprint_node is not None:
+            for bibl_scope in imprint_node.findall(self.BIBL_SCOPE_TAG):
+                bibl_scopes.setdefault(bibl_scope.get("unit"), []).append(bibl_scope)
+        return bibl_scopes
 
-        if reference.find(self.ns["tei"] + "monogr") is not None:
-            monogr_node = reference.find(self.ns["tei"] + "monogr")
-            if monogr_node is not None:
-                imprint_node = monogr_node.find(self.ns["tei"] + "imprint")
-                if imprint_node is not None:
-                    page_list = imprint_node.findall(
-                        self.ns["tei"] + "biblScope[@unit='page']"
-                    )
-        elif reference.find(self.ns["tei"] + "analytic") is not None:
-            analytic_node = reference.find(self.ns["tei"] + "analytic")
-            if analytic_node is not None:
-                imprint_node = analytic_node.find(self.ns["tei"] + "imprint")
-                if imprint_node is not None:
-                    page_list = imprint_node.findall(
-                        self.ns["tei"] + "biblScope[@unit='page']"
-                    )
-
-        for page in page_list:
-            if page is not None:
-                for name, value in sorted(page.items()):
-                    if name == "from":
-                        page_string += value
-                    if name == "to":
-                        page_string += "--" + value
-            else:
-                page_string = "NA"
+    def __get_reference_page_string(self, *, page_nodes: list) -> str:
+        page_string = ""
+        for page in page_nodes:
+            from_page = page.get("from")
+            if from_page is not None:
+                page_string += from_page
+            to_page = page.get("to")
+            if to_page is not None:
+                page_string += "--" + to_page
 
         return page_string
 
-    def __get_reference_number_string(self, *, reference: Element) -> str:
-        number_string = ""
-
-        if reference.find(self.ns["tei"] + "monogr") is not None:
-            monogr_node = reference.find(self.ns["tei"] + "monogr")
-            if monogr_node is not None:
-                imprint_node = monogr_node.find(self.ns["tei"] + "imprint")
-                if imprint_node is not None:
-                    number_list = imprint_node.findall(
-                        self.ns["tei"] + "biblScope[@unit='issue']"
-                    )
-        elif reference.find(self.ns["tei"] + "analytic") is not None:
-            analytic_node = reference.find(self.ns["tei"] + "analytic")
-            if analytic_node is not None:
-                imprint_node = analytic_node.find(self.ns["tei"] + "imprint")
-                if imprint_node is not None:
-                    number_list = imprint_node.findall(
-                        self.ns["tei"] + "biblScope[@unit='issue']"
-                    )
-
-        for number in number_list:
-            if number.text is not None:
-                number_string = number.text
-
-        return number_string
-
-    def __get_reference_volume_string(self, *, reference: Element) -> str:
-        volume_string = ""
-
-        if reference.find(self.ns["tei"] + "monogr") is not None:
-            monogr_node = reference.find(self.ns["tei"] + "monogr")
-            if monogr_node is not None:
-                imprint_node = monogr_node.find(self.ns["tei"] + "imprint")
-                if imprint_node is not None:
-                    volume_list = imprint_node.findall(
-                        self.ns["tei"] + "biblScope[@unit='volume']"
-                    )
-        elif reference.find(self.ns["tei"] + "analytic") is not None:
-            analytic_node = reference.find(self.ns["tei"] + "analytic")
-            if analytic_node is not None:
-                imprint_node = analytic_node.find(self.ns["tei"] + "imprint")
-                if imprint_node is not None:
-                    volume_list = imprint_node.findall(
-                        self.ns["tei"] + "biblScope[@unit='volume']"
-                    )
-
-        for volume in volume_list:
-            if volume.text is not None:
-                volume_string = volume.text
-
-        return volume_string
+    def __get_reference_text_string(self, *, nodes: list) -> str:
+        # Note : used for the issue/volume biblScope nodes (the last text is used)
+        return next(
+            (node.text for node in reversed(nodes) if node.text is not None), ""
+        )
 
-    def __get_reference_journal_string(self, *, reference: Element) -> str:
+    def __get_reference_journal_string(self, *, monogr_node: Optional[Element]) -> str:
         journal_title = ""
-        if reference.find(self.ns["tei"] + "monogr") is not None:
-            monogr_node = reference.find(self.ns["tei"] + "monogr")
-            if monogr_node is not None:
-                monogr_title = monogr_node.find(self.ns["tei"] + "title")
-                if monogr_title is not None:
-                    if monogr_title.text is not None:
-                        journal_title = monogr_title.text
+        if monogr_node is not None:
+            monogr_title = monogr_node.find(self.TITLE_TAG)
+            if monogr_title is not None:
+                if monogr_title.text is not None:
+                    journal_title = monogr_title.text
 
         return journal_title
 
-    def __get_entrytype(self, *, reference: Element) -> str:
-        entrytype = "misc"
-        if reference.find(self.ns["tei"] + "monogr") is not None:
-            monogr_node = reference.find(self.ns["tei"] + "monogr")
-            if monogr_node is not None:
-                title_node = monogr_node.find(self.ns["tei"] + "title")
-                if title_node is not None:
-                    if title_node.get("level", "NA") != "j":
-                        entrytype = "book"
-                    else:
-                        entrytype = "article"
-        return entrytype
-
-    def __get_tei_id_count(self, *, tei_id: str) -> int:
-        count = 0
-
-        for reference in self.root.iter(self.ns["tei"] + "ref"):
-            if "target" in reference.keys():
-                if reference.get("target") == f"#{tei_id}":
-                    count += 1
-
-        return count
+    def __get_entrytype(self, *, monogr_node: Optional[Element]) -> str:
+        if monogr_node is None:
+            return "misc"
+        title_node = monogr_node.find(self.TITLE_TAG)
+        if title_node is None:
+            return "misc"
+        if title_node.get("level") != "j":
+            return "book"
+        return "article"
+
+    def __parse_reference(self, *, reference: Element, tei_id: str) -> dict:
+        # Note : locate the analytic/monogr/imprint nodes once per reference.
+        # Authors/titles are taken from the analytic node (if available),
+        # the imprint (year, pages, ...) from the monogr node (if available).
+        analytic_node = reference.find(self.ANALYTIC_TAG)
+        monogr_node = reference.find(self.MONOGR_TAG)
+        main_node = analytic_node if analytic_node is not None else monogr_node
+        imprint_parent = monogr_node if monogr_node is not None else analytic_node
+        imprint_node = None
+        if imprint_parent is not None:
+            imprint_node = imprint_parent.find(self.IMPRINT_TAG)
+
+        entrytype = self.__get_entrytype(monogr_node=monogr_node)
+        ref_rec = {
+            "ID": tei_id,
+            "ENTRYTYPE": entrytype,
+            "tei_id": tei_id,
+            "author": self.__get_reference_author_string(main_node=main_node),
+            "title": self.__get_reference_title_string(main_node=main_node),
+        }
+        if entrytype in ["article", "book"]:
+            ref_rec["year"] = self.__get_reference_year_string(
+                imprint_node=imprint_node
+            )
+        if entrytype == "article":
+            ref_rec["journal"] = self.__get_reference_journal_string(
+                monogr_node=monogr_node
+            )
+            bibl_scopes = self.__get_reference_bibl_scopes(imprint_node=imprint_node)
+            ref_rec["volume"] = self.__get_reference_text_string(
+                nodes=bibl_scopes.get("volume", [])
+            )
+            ref_rec["number"] = self.__get_reference_text_string(
+                nodes=bibl_scopes.get("issue", [])
+            )
+            ref_rec["pages"] = self.__get_reference_page_string(
+                page_nodes=bibl_scopes.get("page", [])
+            )
+        return ref_rec
+
+    def __get_tei_id_counts(self) -> Counter:
+        # Note : the in-text citations are counted in a single pass (for all tei_ids)
+        return Counter(
+            target[1:]
+            for target in (
+                reference.get("target", "")
+                for reference in self.root.iter(self.REF_TAG)
+            )
+            if target.startswith("#")
+        )
 
     def get_bibliography(self, *, min_intext_citations: int = 0) -> list:
         """Get the bibliography (references section) as a list of record dicts"""
         # Note : could also allow top-10 % of most frequent in-text citations
 
-        bibliographies = self.root.iter(self.ns["tei"] + "listBibl")
+        tei_id_counts: Counter = Counter()
+        if min_intext_citations > 0:
+            tei_id_counts = self.__get_tei_id_counts()
+
+        bibliographies = self.root.iter(self.LIST_BIBL_TAG)
         tei_bib_db = []
         for bibliography in bibliographies:
             for reference in bibliography:
                 try:
-                    entrytype = self.__get_entrytype(reference=reference)
                     tei_id = self.__get_reference_bibliography_tei_id(
                         reference=reference
                     )
 
                     if min_intext_citations > 0:
-                        if (
-                            self.__get_tei_id_count(tei_id=tei_id)
-                            < min_intext_citations
-                        ):
+                        if tei_id_counts[tei_id] < min_intext_citations:
                             continue
 
-                    if entrytype == "article":
-                        ref_rec = {
-                            "ID": tei_id,
-                            "ENTRYTYPE": entrytype,
-                            "tei_id": tei_id,
-                            "author": self.__get_reference_author_string(
-                                reference=reference
-                            ),
-                            "title": self.__get_reference_title_string(
-                                reference=reference
-                            ),
-                            "year": self.__get_reference_year_string(
-                                reference=reference
-                            ),
-                            "journal": self.__get_reference_journal_string(
-                                reference=reference
-                            ),
-                            "volume": self.__get_reference_volume_string(
-                                reference=reference
-                            ),
-                            "number": self.__get_reference_number_string(
-                                reference=reference
-                            ),
-                            "pages": self.__get_reference_page_string(
-                                reference=reference
-                            ),
-                        }
-                    elif entrytype == "book":
-                        ref_rec = {
-                            "ID": tei_id,
-                            "ENTRYTYPE": entrytype,
-                            "tei_id": tei_id,
-                            "author": self.__get_reference_author_string(
-                                reference=reference
-                            ),
-                            "title": self.__get_reference_title_string(
-                                reference=reference
-                            ),
-                            "year": self.__get_reference_year_string(
-                                reference=reference
-                            ),
-                        }
-                    elif entrytype == "misc":
-                        ref_rec = {
-                            "ID": tei_id,
-                            "ENTRYTYPE": entrytype,
-                            "tei_id": tei_id,
-                            "author": self.__get_reference_author_string(
-                                reference=reference
-                            ),
-                            "title": self.__get_reference_title_string(
-                                reference=reference
-                            ),
-                        }
-                except etree.ElementTree.ParseError:
+                    ref_rec = self.__parse_reference(reference=reference, tei_id=tei_id)
+                # Note : missing sub-elements are handled by explicit None-checks.
+                # AttributeError is only caught as a safety net.
+                except (etree.ElementTree.ParseError, AttributeError):
                     continue
 
-                ref_rec = {k: v for k, v in ref_rec.items() if v is not None}
+                # Note : __parse_reference() only sets str values (no None)
                 # print(ref_rec)
                 tei_bib_db.append(ref_rec)
 
@@ -772,66 +730,166 @@ class TEIParser:
     def get_citations_per_section(self) -> dict:
         """Get a dict of section-names and list-of-citations"""
         section_citations = {}
-        parent_map = {c: p for p in self.root.iter() for c in p}
-        sections = self.root.iter(f'{self.ns["tei"]}head')
+        # Note : only the parents of head elements are mapped.
+        # find()/iter() with plain tags are evaluated in C (unlike ".//" paths)
+        parent_map = {
+            section: parent
+            for parent in self.root.iter()
+            if parent.find(self.HEAD_TAG) is not None
+            for section in parent.findall(self.HEAD_TAG)
+        }
+        sections = self.root.iter(self.HEAD_TAG)
         for section in sections:
             section_name = section.text
             if section_name is None:
                 continue
             parent = parent_map[section]
-            citation_nodes = parent.findall(f'.//{self.ns["tei"]}ref')
             citations = [
-                x.get("target", "NA").replace("#", "")
-                for x in citation_nodes
-                if x.get("type", "NA") == "bibr"
+                citation
+                for citation in (
+                    x.get("target", "NA").replace("#", "")
+                    for x in parent.iter(self.REF_TAG)
+                    if x.get("type") == "bibr"
+                )
+                if citation != "NA"
             ]
-            citations = list(filter(lambda a: a != "NA", citations))
-            if len(citations) > 0:
+            if citations:
                 section_citations[section_name.lower()] = citations
         return section_citations
 
+    def __get_similarity_blocking_key(self, *, record_dict: dict) -> tuple:
+        # Note : get_record_similarity() weights volume and number with 0.12 and 0.1
+        # (0.275 and 0.2 for common titles) and scores them as exact matches.
+        # A mismatch in either field caps the score at 0.9 or below,
+        # which cannot exceed the threshold in mark_references().
+        # Missing/UNKNOWN values are compared as "" (as in get_record_similarity())
+        return tuple(
+            "" if record_dict.get(key, "UNKNOWN") == "UNKNOWN" else record_dict[key]
+            for key in ["volume", "number"]
+        )
+
+    def __get_similarity_title(self, *, record_dict: dict) -> str:
+        # Note : preprocessed as in get_record_similarity()
+        title = record_dict.get("title", "UNKNOWN")
+        if title == "UNKNOWN":
+            return ""
+        return str(title).lower().replace(":", "").replace("-", "")
+
+    def __get_similarity_fields(self, *, record_dict: dict) -> tuple:
+        return tuple(
+            (key, record_dict[key])
+            for key in self.SIMILARITY_FIELDS
+            if key in record_dict
+        )
+
+    # Note : the similarities are cached based on the field values
+    # (the same references are often cited in different TEIs)
+    @staticmethod
+    @lru_cache(maxsize=10000)
+    def __get_cached_record_similarity(
+        record_a_fields: tuple, record_b_fields: tuple
+    ) -> float:
+        return colrev.record.Record.get_record_similarity(
+            record_a=colrev.record.Record(data=dict(record_a_fields)),
+            record_b=colrev.record.Record(data=dict(record_b_fields)),
+        )
+
+    def __get_similarity_candidates(self, *, records: dict) -> dict:
+        # Note : index the included records by their blocking key
+        # to avoid comparing all pairs of TEI and local records
+        candidates_by_key: dict = {}
+        for local_record_dict in records.values():
+            if local_record_dict["colrev_status"] not in self.MARK_REFERENCES_STATES:
+                continue
+            titles, local_records = candidates_by_key.setdefault(
+                self.__get_similarity_blocking_key(record_dict=local_record_dict),
+                ([], []),
+            )
+            titles.append(self.__get_similarity_title(record_dict=local_record_dict))
+            local_records.append(
+                (
+                    local_record_dict["ID"],
+                    self.__get_similarity_fields(record_dict=local_record_dict),
+                )
+            )
+        return candidates_by_key
+
+    def __select_similarity_candidates(
+        self, *, record_dict: dict, candidates_by_key: dict
+    ) -> list:
+        titles, local_records = candidates_by_key.get(
+            self.__get_similarity_blocking_key(record_dict=record_dict), ([], [])
+        )
+        # Note : the titles of the candidates are compared in bulk (rapidfuzz)
+        # before the (more expensive) get_record_similarity() is called.
+        # The candidates are compared in their original order.
+        candidate_indices = sorted(
+            index
+            for _, _, index in process.extract(
+                self.__get_similarity_title(record_dict=record_dict),
+                titles,
+                scorer=fuzz.ratio,
+                score_cutoff=self.MARK_REFERENCES_TITLE_CUTOFF,
+                limit=None,
+            )
+        )
+        return [local_records[index] for index in candidate_indices]
+
+    def __mark_record_ids(self, *, tei_id_to_record_id: dict) -> None:
+        bibliography = self.root.find(self.LIST_BIBL_PATH)
+        # mark reference in bibliography
+        for ref in bibliography:
+            tei_id = ref.get(self.W3_ID_ATTRIBUTE)
+            if tei_id in tei_id_to_record_id:
+                ref.set("ID", tei_id_to_record_id[tei_id])
+        # mark reference in in-text citations
+        for reference in self.root.iter(self.REF_TAG):
+            target = reference.get("target", "")
+            if target.startswith("#") and target[1:] in tei_id_to_record_id:
+                reference.set("ID", tei_id_to_record_id[target[1:]])
+
     def mark_references(self, *, records: dict):  # type: ignore
         """Mark references with the additional record ID"""
 
+        candidates_by_key = self.__get_similarity_candidates(records=records)
+
+        # Note : collect the matches (tei_id -> record ID) first
+        # and mark the tei in a single pass afterwards
+        tei_id_to_record_id = {}
         tei_records = self.get_bibliography()
         for record_dict in tei_records:
             if "title" not in record_dict:
                 continue
 
+            # Note : the similarity fields are extracted once (not per comparison)
+            tei_record_fields = self.__get_similarity_fields(record_dict=record_dict)
             max_sim = 0.9
-            max_sim_record = {}
-            for local_record_dict in records.values():
-                if local_record_dict["colrev_status"] not in [
-                    colrev.record.RecordState.rev_included,
-                    colrev.record.RecordState.rev_synthesized,
-                ]:
-                    continue
-                rec_sim = colrev.record.Record.get_record_similarity(
-                    record_a=colrev.record.Record(data=record_dict),
-                    record_b=colrev.record.Record(data=local_record_dict),
+            max_sim_record_id = None
+            for (
+                local_record_id,
+                local_record_fields,
+            ) in self.__select_similarity_candidates(
+                record_dict=record_dict, candidates_by_key=candidates_by_key
+            ):
+                rec_sim = self.__get_cached_record_similarity(
+                    tei_record_fields, local_record_fields
                 )
                 if rec_sim > max_sim:
-                    max_sim_record = local_record_dict
+                    max_sim_record_id = local_record_id
                     max_sim = rec_sim
-            if len(max_sim_record) == 0:
+            if max_sim_record_id is None:
                 continue
 
-            # Record found: mark in tei
-            bibliography = self.root.find(f".//{self.ns['tei']}listBibl")
-            # mark reference in bibliography
-            for ref in bibliography:
-                if ref.get(f'{self.ns["w3"]}id') == record_dict["tei_id"]:
-                    ref.set("ID", max_sim_record["ID"])
-            # mark reference in in-text citations
-            for reference in self.root.iter(f'{self.ns["tei"]}ref'):
-                if "target" in reference.keys():
-                    if reference.get("target") == f"#{record_dict['tei_id']}":
-                        reference.set("ID", max_sim_record["ID"])
+            tei_id_to_record_id[record_dict["tei_id"]] = max_sim_record_id
 
             # if settings file available: dedupe_io match agains records
 
-        if self.tei_path:
-            tree = etree.ElementTree.ElementTree(self.root)
-            tree.write(str(self.tei_path))
+        # Note : the tei is only serialized and written if references were marked
+        if tei_id_to_record_id:
+            self.__mark_record_ids(tei_id_to_record_id=tei_id_to_record_id)
+
+            if self.tei_path:
+                tree = etree.ElementTree.ElementTree(self.root)
+                tree.write(str(self.tei_path))
 
         return self.root
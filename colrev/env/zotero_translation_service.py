@@ -24,6 +24,7 @@ class ZoteroTranslationService:
     ) -> None:
         self.image_name = "zotero/translation-server:2.0.4"
         environment_manager.build_docker_image(imagename=self.image_name)
+        self.session = requests.Session()
 
     def stop(self) -> None:
         """Stop the zotero translation service"""
@@ -54,11 +55,13 @@ class ZoteroTranslationService:
                 detach=True,
             )
 
-            tries = 0
-            while tries < 10:
+            # Note : poll with an exponential backoff (the service often starts quickly)
+            delay = 0.1
+            start_time = time.monotonic()
+            while time.monotonic() - start_time < 50:
                 try:
                     headers = {"Content-type": "text/plain"}
-                    requests.post(
+                    self.session.post(
                         "http://127.0.0.1:1969/import",
                         headers=headers,
                         data=b"%T Paper title\n\n",
@@ -66,7 +69,8 @@ class ZoteroTranslationService:
                     )
 
                 except requests.ConnectionError:
-                    time.sleep(5)
+                    time.sleep(delay)
+                    delay = min(delay * 1.5, 2.0)
                     continue
                 return
 
@@ -47,18 +47,16 @@ class CiteAsPrep(JsonSchemaMixin):
         _, self.email = prep_operation.review_manager.get_committer()
 
     def __cite_as_json_to_record(
-        self, *, json_str: str, url: str
+        self, *, json_bytes: bytes, url: str
     ) -> colrev.record.PrepRecord:
         retrieved_record: dict = {}
-        data = json.loads(json_str)
+        data = json.loads(json_bytes)
 
         if "author" in data["metadata"]:
-            authors = data["metadata"]["author"]
-            authors_string = ""
-            for author in authors:
-                authors_string += author.get("family", "") + ", "
-                authors_string += author.get("given", "") + " "
-            authors_string = authors_string.lstrip().rstrip().replace("  ", " ")
+            authors_string = " and ".join(
+                f"{author.get('family', '')}, {author.get('given', '')}".strip(", ")
+                for author in data["metadata"]["author"]
+            )
             retrieved_record.update(author=authors_string)
         if "container-title" in data["metadata"]:
             container_title = data["metadata"]["container-title"]
@@ -103,7 +101,9 @@ class CiteAsPrep(JsonSchemaMixin):
             )
             ret.raise_for_status()
 
-            retrieved_record = self.__cite_as_json_to_record(json_str=ret.text, url=url)
+            retrieved_record = self.__cite_as_json_to_record(
+                json_bytes=ret.content, url=url
+            )
 
             similarity = colrev.record.PrepRecord.get_retrieval_similarity(
                 record_original=retrieved_record,
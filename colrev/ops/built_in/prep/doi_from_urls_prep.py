@@ -7,6 +7,7 @@ import re
 from dataclasses import dataclass
 from sqlite3 import OperationalError
 from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 import requests
 import zope.interface
@@ -37,7 +38,23 @@ class DOIFromURLsPrep(JsonSchemaMixin):
     always_apply_changes = False
 
     # https://www.crossref.org/blog/dois-and-matching-regular-expressions/
-    doi_regex = re.compile(r"10\.\d{4,9}/[-._;/:A-Za-z0-9]*")
+    # Note : the pattern is applied to the raw page (bytes) and only matches ASCII
+    doi_regex = re.compile(rb"10\.\d{4,9}/[-._;/:A-Za-z0-9]*")
+    # Note : only the most frequent DOIs on a page are retrieved
+    max_doi_candidates = 3
+    # Note : websites that do not provide (the record's) DOI
+    no_doi_hosts = frozenset(
+        {
+            "google.com",
+            "scholar.google.com",
+            "books.google.com",
+            "youtube.com",
+            "amazon.com",
+            "twitter.com",
+            "facebook.com",
+            "linkedin.com",
+        }
+    )
 
     def __init__(
         self,
@@ -69,51 +86,53 @@ class DOIFromURLsPrep(JsonSchemaMixin):
 
         try:
             url = record.data.get("url", record.data.get("fulltext", "NA"))
+            host = urlsplit(url).hostname or ""
+            if host.startswith("www."):
+                host = host[4:]
+            if host in self.no_doi_hosts:
+                return record
+
             headers = {"user-agent": f"{__name__}  " f"(mailto:{self.email})"}
             ret = self.session.request(
                 "GET", url, headers=headers, timeout=prep_operation.timeout
             )
             ret.raise_for_status()
-            res = re.findall(self.doi_regex, ret.text)
-            if not res:
-                return record
-
-            if len(res) == 1:
-                ret_dois = [(res[0], 1)]
-            else:
-                counter = collections.Counter(res)
-                ret_dois = counter.most_common()
-
-            if not ret_dois:
+            if b"10." not in ret.content:
                 return record
 
-            doi, _ = ret_dois[0]
-
-            retrieved_record_dict = {
-                "doi": doi.upper(),
-                "ID": record.data["ID"],
-            }
-            retrieved_record = colrev.record.PrepRecord(data=retrieved_record_dict)
-            doi_connector.DOIConnector.retrieve_doi_metadata(
-                review_manager=prep_operation.review_manager,
-                record=retrieved_record,
-                timeout=prep_operation.timeout,
+            # Note : the DOIs are counted while scanning (no intermediate list)
+            counter = collections.Counter(
+                match.group(0) for match in self.doi_regex.finditer(ret.content)
             )
-
-            similarity = colrev.record.PrepRecord.get_retrieval_similarity(
-                record_original=record,
-                retrieved_record_original=retrieved_record,
-                same_record_type_required=self.same_record_type_required,
-            )
-            if similarity < prep_operation.retrieval_similarity:
-                return record
-
-            record.merge(merging_record=retrieved_record, default_source=url)
-
-        except (
-            requests.exceptions.RequestException,
-            colrev_exceptions.InvalidMerge,
-            colrev_exceptions.RecordNotParsableException,
-        ):
+            for doi, _ in counter.most_common(self.max_doi_candidates):
+                retrieved_record_dict = {
+                    "doi": doi.decode("ascii").upper(),
+                    "ID": record.data["ID"],
+                }
+                retrieved_record = colrev.record.PrepRecord(data=retrieved_record_dict)
+                try:
+                    doi_connector.DOIConnector.retrieve_doi_metadata(
+                        review_manager=prep_operation.review_manager,
+                        record=retrieved_record,
+                        timeout=prep_operation.timeout,
+                    )
+
+                    similarity = colrev.record.PrepRecord.get_retrieval_similarity(
+                        record_original=record,
+                        retrieved_record_original=retrieved_record,
+                        same_record_type_required=self.same_record_type_required,
+                    )
+                    if similarity < prep_operation.retrieval_similarity:
+                        continue
+
+                    record.merge(merging_record=retrieved_record, default_source=url)
+                    break
+                except (
+                    colrev_exceptions.InvalidMerge,
+                    colrev_exceptions.RecordNotParsableException,
+                ):
+                    continue
+
+        except requests.exceptions.RequestException:
             pass
         return record
@@ -26,13 +26,35 @@ if TYPE_CHECKING:
 class ExcludeLanguagesPrep(JsonSchemaMixin):
     """Prepares records by excluding ones that are not in the languages_to_include"""
 
-    settings_class = colrev.env.package_manager.DefaultSettings
+    settings: ExcludeLanguagesSettings
+
+    @dataclass
+    class ExcludeLanguagesSettings(
+        colrev.env.package_manager.DefaultSettings, JsonSchemaMixin
+    ):
+        """Settings for ExcludeLanguagesPrep"""
+
+        endpoint: str
+        detector_backend: str
+
+        _details = {
+            "detector_backend": {
+                "tooltip": "Language detection library (lingua or langid). "
+                "langid (py3langid) is faster but less accurate for short titles"
+            },
+        }
+
+    settings_class = ExcludeLanguagesSettings
     ci_supported: bool = True
 
     source_correction_hint = "check with the developer"
     always_apply_changes = True
 
     def __init__(self, *, prep_operation: colrev.ops.prep.Prep, settings: dict) -> None:
+        # Set default values (if necessary)
+        if "detector_backend" not in settings:
+            settings["detector_backend"] = "lingua"
+
         self.settings = self.settings_class.load_settings(data=settings)
 
         # Note : the following objects have heavy memory footprints and should be
@@ -40,7 +62,9 @@ class ExcludeLanguagesPrep(JsonSchemaMixin):
         # efficient as possible (the object is passed to each thread)
         languages_to_include = ["eng"]
         # if not prep_operation.review_manager.in_ci_environment():
-        self.language_service = colrev.env.language_service.LanguageService()
+        self.language_service = colrev.env.language_service.LanguageService(
+            detector_backend=self.settings.detector_backend
+        )
 
         prescreen_package_endpoints = (
             prep_operation.review_manager.settings.prescreen.prescreen_package_endpoints
@@ -2,11 +2,12 @@
 """Exclude records with non-latin alphabets as a prep operation"""
 from __future__ import annotations
 
+import unicodedata
 from dataclasses import dataclass
+from typing import Optional
 from typing import TYPE_CHECKING
 
 import zope.interface
-from alphabet_detector import AlphabetDetector
 from dataclasses_jsonschema import JsonSchemaMixin
 
 import colrev.env.package_manager
@@ -21,6 +22,21 @@ if TYPE_CHECKING:
 # pylint: disable=too-few-public-methods
 
 
+class NonLatinLetterTable(dict):
+    """Translation table that keeps non-latin letters and removes other characters
+    (the classification of each character is computed once and cached)"""
+
+    def __missing__(self, key: int) -> Optional[str]:
+        # Note : same classification as AlphabetDetector.only_alphabet_chars(...)
+        # (letters whose unicode name does not contain LATIN)
+        character = chr(key)
+        value = None
+        if character.isalpha() and "LATIN" not in unicodedata.name(character, ""):
+            value = character
+        self[key] = value
+        return value
+
+
 @zope.interface.implementer(colrev.env.package_manager.PrepPackageEndpointInterface)
 @dataclass
 class ExcludeNonLatinAlphabetsPrep(JsonSchemaMixin):
@@ -32,7 +48,7 @@ class ExcludeNonLatinAlphabetsPrep(JsonSchemaMixin):
 
     source_correction_hint = "check with the developer"
     always_apply_changes = True
-    alphabet_detector = AlphabetDetector()
+    non_latin_letter_table = NonLatinLetterTable()
 
     def __init__(
         self,
@@ -54,10 +70,9 @@ class ExcludeNonLatinAlphabetsPrep(JsonSchemaMixin):
 
         def mostly_latin_alphabet(str_to_check: str) -> bool:
             assert len(str_to_check) != 0
-            nr_non_latin = 0
-            for character in str_to_check:
-                if not self.alphabet_detector.only_alphabet_chars(character, "LATIN"):
-                    nr_non_latin += 1
+            # Note : str.translate() iterates over the characters in C
+            # (only the non-latin letters remain)
+            nr_non_latin = len(str_to_check.translate(self.non_latin_letter_table))
             return nr_non_latin / len(str_to_check) > 0.75
 
         # TB:D join or check independently?
@@ -69,6 +84,9 @@ class ExcludeNonLatinAlphabetsPrep(JsonSchemaMixin):
                 record.data.get("booktitle", ""),
             ]
         )
+        # Note : ASCII strings do not contain non-latin letters (most records)
+        if str_to_check.isascii():
+            return record
         if mostly_latin_alphabet(str_to_check):
             record.prescreen_exclude(reason="non_latin_alphabet")
 
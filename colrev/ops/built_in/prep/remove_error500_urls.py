@@ -2,6 +2,7 @@
 """Removal of broken URLs (error 500) a prep operation"""
 from __future__ import annotations
 
+import typing
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -38,6 +39,35 @@ class RemoveError500URLsPrep(JsonSchemaMixin):
         settings: dict,
     ) -> None:
         self.settings = self.settings_class.load_settings(data=settings)
+        # Note : the status codes are cached per url (across records and fields).
+        # The responses are also cached across runs (get_cached_session)
+        self.__status_codes: typing.Dict[str, int] = {}
+
+    def __get_status_code(
+        self,
+        *,
+        session: requests.Session,
+        url: str,
+        headers: dict,
+        timeout: int,
+    ) -> int:
+        if url in self.__status_codes:
+            return self.__status_codes[url]
+
+        # Note : HEAD requests avoid downloading the body (e.g., PDFs)
+        ret = session.request(
+            "HEAD", url, headers=headers, timeout=timeout, allow_redirects=True
+        )
+        status_code = ret.status_code
+        if status_code >= 400:
+            # Some servers reject HEAD requests: confirm with a (streamed) GET request
+            with session.request(
+                "GET", url, headers=headers, timeout=timeout, stream=True
+            ) as ret:
+                status_code = ret.status_code
+
+        self.__status_codes[url] = status_code
+        return status_code
 
     def prepare(
         self, prep_operation: colrev.ops.prep.Prep, record: colrev.record.PrepRecord
@@ -48,25 +78,25 @@ class RemoveError500URLsPrep(JsonSchemaMixin):
 
         try:
             if "url" in record.data:
-                ret = session.request(
-                    "GET",
-                    record.data["url"],
+                status_code = self.__get_status_code(
+                    session=session,
+                    url=record.data["url"],
                     headers=prep_operation.requests_headers,
                     timeout=60,
                 )
-                if ret.status_code >= 500:
+                if status_code >= 500:
                     record.remove_field(key="url")
         except requests.exceptions.RequestException:
             pass
         try:
             if "fulltext" in record.data:
-                ret = session.request(
-                    "GET",
-                    record.data["fulltext"],
+                status_code = self.__get_status_code(
+                    session=session,
+                    url=record.data["fulltext"],
                     headers=prep_operation.requests_headers,
                     timeout=prep_operation.timeout,
                 )
-                if ret.status_code >= 500:
+                if status_code >= 500:
                     record.remove_field(key="fulltext")
         except requests.exceptions.RequestException:
             pass
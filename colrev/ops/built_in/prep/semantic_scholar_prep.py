@@ -36,6 +36,14 @@ class SemanticScholarPrep(JsonSchemaMixin):
     )
     always_apply_changes = False
 
+    # Note : the search returns all fields that are needed (no separate request
+    # for each paper) and only the top hit is used
+    SEARCH_API_URL = (
+        "https://api.semanticscholar.org/graph/v1/paper/search?"
+        "fields=title,authors,abstract,year,venue,externalIds,url&limit=1&query="
+    )
+    PAPER_URL = "https://api.semanticscholar.org/v1/paper/"
+
     def __init__(
         self,
         *,
@@ -46,6 +54,9 @@ class SemanticScholarPrep(JsonSchemaMixin):
         _, email = prep_operation.review_manager.get_committer()
         self.headers = {"user-agent": f"{__name__} (mailto:{email})"}
         self.session = prep_operation.review_manager.get_cached_session()
+        self.same_record_type_required = (
+            prep_operation.review_manager.settings.is_curated_masterdata_repo()
+        )
 
     def __get_record_from_item(
         self, *, item: dict, record_in: colrev.record.PrepRecord
@@ -62,9 +73,9 @@ class SemanticScholarPrep(JsonSchemaMixin):
             retrieved_record.update(author=authors_string)
         if "abstract" in item:
             retrieved_record.update(abstract=item["abstract"])
-        if "doi" in item:
-            if str(item["doi"]).lower() != "none":
-                retrieved_record.update(doi=str(item["doi"]).upper())
+        if "DOI" in (item.get("externalIds") or {}):
+            if str(item["externalIds"]["DOI"]).lower() != "none":
+                retrieved_record.update(doi=str(item["externalIds"]["DOI"]).upper())
         if "title" in item:
             retrieved_record.update(title=item["title"])
         if "year" in item:
@@ -105,24 +116,15 @@ class SemanticScholarPrep(JsonSchemaMixin):
         )
         ret.raise_for_status()
 
-        data = json.loads(ret.text)
+        data = json.loads(ret.content)
         items = data["data"]
         if len(items) == 0:
             return record_in
         if "paperId" not in items[0]:
             return record_in
 
-        paper_id = items[0]["paperId"]
-        record_retrieval_url = "https://api.semanticscholar.org/v1/paper/" + paper_id
-        # prep_operation.review_manager.logger.debug(record_retrieval_url)
-        ret_ent = self.session.request(
-            "GET",
-            record_retrieval_url,
-            headers=self.headers,
-            timeout=prep_operation.timeout,
-        )
-        ret_ent.raise_for_status()
-        item = json.loads(ret_ent.text)
+        item = items[0]
+        record_retrieval_url = self.PAPER_URL + item["paperId"]
 
         record = self.__get_record_from_item(item=item, record_in=record_in)
         record.add_provenance_all(source=record_retrieval_url)
@@ -134,14 +136,8 @@ class SemanticScholarPrep(JsonSchemaMixin):
     ) -> colrev.record.Record:
         """Prepare a record based on metadata from SemanticScholar"""
 
-        same_record_type_required = (
-            prep_operation.review_manager.settings.is_curated_masterdata_repo()
-        )
         try:
-            search_api_url = (
-                "https://api.semanticscholar.org/graph/v1/paper/search?query="
-            )
-            url = search_api_url + record.data.get("title", "").replace(" ", "+")
+            url = self.SEARCH_API_URL + record.data.get("title", "").replace(" ", "+")
 
             retrieved_record = self.retrieve_record_from_semantic_scholar(
                 prep_operation=prep_operation, url=url, record_in=record
@@ -159,7 +155,7 @@ class SemanticScholarPrep(JsonSchemaMixin):
             similarity = colrev.record.PrepRecord.get_retrieval_similarity(
                 record_original=orig_record,
                 retrieved_record_original=retrieved_record,
-                same_record_type_required=same_record_type_required,
+                same_record_type_required=self.same_record_type_required,
             )
             if similarity > prep_operation.retrieval_similarity:
                 # prep_operation.review_manager.logger.debug("Found matching record")
@@ -43,6 +43,21 @@ class SourceSpecificPrep(JsonSchemaMixin):
         self.search_sources = colrev.ops.search_sources.SearchSources(
             review_manager=prep_operation.review_manager
         )
+        # Note : the (endpoint, source) pairs are determined once per origin_source
+        self.__source_endpoints: dict = {}
+
+    def __get_source_endpoints(
+        self, *, prep_operation: colrev.ops.prep.Prep, origin_source: str
+    ) -> list:
+        if origin_source not in self.__source_endpoints:
+            self.__source_endpoints[origin_source] = [
+                (self.search_sources.packages[s.endpoint], s)
+                for s in prep_operation.review_manager.settings.sources
+                if s.filename.with_suffix(".bib")
+                == Path("data/search") / Path(origin_source)
+                and s.endpoint in self.search_sources.packages
+            ]
+        return self.__source_endpoints[origin_source]
 
     def prepare(
         self, prep_operation: colrev.ops.prep.Prep, record: colrev.record.PrepRecord
@@ -51,20 +66,11 @@ class SourceSpecificPrep(JsonSchemaMixin):
 
         # Note : we take the first origin (ie., the source-specific prep should
         # be one of the first in the prep-list)
-        origin_source = record.data["colrev_origin"][0].split("/")[0]
-
-        sources = [
-            s
-            for s in prep_operation.review_manager.settings.sources
-            if s.filename.with_suffix(".bib")
-            == Path("data/search") / Path(origin_source)
-        ]
-
-        for source in sources:
-            if source.endpoint not in self.search_sources.packages:
-                continue
-            endpoint = self.search_sources.packages[source.endpoint]
+        origin_source = record.data["colrev_origin"][0].split("/", maxsplit=1)[0]
 
+        for endpoint, source in self.__get_source_endpoints(
+            prep_operation=prep_operation, origin_source=origin_source
+        ):
             if callable(endpoint.prepare):
                 record = endpoint.prepare(record, source)
             else:
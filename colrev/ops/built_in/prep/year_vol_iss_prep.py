@@ -2,6 +2,7 @@
 """Completion of metadata based on year-volume-issue dependency as a prep operation"""
 from __future__ import annotations
 
+import collections
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -180,8 +181,8 @@ class YearVolIssPrep(JsonSchemaMixin):
             years = [r.data["year"] for r in retrieved_records]
             if len(years) == 0:
                 return
-            most_common = max(years, key=years.count)
-            if years.count(most_common) > 3:
+            most_common, count = collections.Counter(years).most_common(1)[0]
+            if count > 3:
                 record.update_field(
                     key="year", value=most_common, source="CROSSREF(average)", note=""
                 )
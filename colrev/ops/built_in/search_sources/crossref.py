@@ -46,6 +46,8 @@ if TYPE_CHECKING:
 class CrossrefSearchSource(JsonSchemaMixin):
     """SearchSource for the Crossref API"""
 
+    # pylint: disable=too-many-instance-attributes
+
     __issn_regex = r"^\d{4}-?\d{3}[\dxX]$"
 
     # https://github.com/CrossRef/rest-api-doc
@@ -104,6 +106,9 @@ class CrossrefSearchSource(JsonSchemaMixin):
         self.language_service = colrev.env.language_service.LanguageService()
 
         self.review_manager = source_operation.review_manager
+        self.__curated_masterdata = (
+            self.review_manager.settings.is_curated_masterdata_repo()
+        )
         self.etiquette = self.get_etiquette(review_manager=self.review_manager)
         self.email = self.review_manager.get_committer()
 
@@ -307,9 +312,7 @@ class CrossrefSearchSource(JsonSchemaMixin):
             record=record,
         )
 
-        if (
-            self.review_manager.settings.is_curated_masterdata_repo()
-        ) and "cited_by" in record.data:
+        if self.__curated_masterdata and "cited_by" in record.data:
             del record.data["cited_by"]
 
         if not prep_main_record:
@@ -349,7 +352,7 @@ class CrossrefSearchSource(JsonSchemaMixin):
                 # )
                 return []
 
-            data = json.loads(ret.text)
+            data = json.loads(ret.content)
 
         # pylint: disable=duplicate-code
         except OperationalError as exc:
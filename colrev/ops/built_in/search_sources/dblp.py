@@ -6,6 +6,8 @@ import html
 import json
 import re
 import typing
+import unicodedata
+from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
 from multiprocessing import Lock
@@ -35,6 +37,8 @@ import colrev.settings
 class DBLPSearchSource(JsonSchemaMixin):
     """SearchSource for DBLP"""
 
+    # pylint: disable=too-many-instance-attributes
+
     __api_url = "https://dblp.org/search/publ/api?q="
     __api_url_venues = "https://dblp.org/search/venue/api?q="
     __START_YEAR = 1980
@@ -106,6 +110,14 @@ class DBLPSearchSource(JsonSchemaMixin):
         self.dblp_lock = Lock()
         self.origin_prefix = self.search_source.get_origin_prefix()
         self.review_manager = source_operation.review_manager
+        self.__same_record_type_required = (
+            source_operation.review_manager.settings.is_curated_masterdata_repo()
+        )
+
+        # Note : DBLP candidates retrieved for a (normalized) title are kept
+        # for the lifetime of the endpoint (e.g., a prep round)
+        # so that duplicates do not trigger the same query again
+        self.__title_cache: dict[str, list] = {}
 
         _, self.email = source_operation.review_manager.get_committer()
 
@@ -163,7 +175,7 @@ class DBLPSearchSource(JsonSchemaMixin):
         try:
             ret = session.request("GET", url, headers=headers, timeout=self.__timeout)
             ret.raise_for_status()
-            data = json.loads(ret.text)
+            data = json.loads(ret.content)
             if "hit" not in data["result"]["hits"]:
                 return ""
             hits = data["result"]["hits"]["hit"]
@@ -220,7 +232,7 @@ class DBLPSearchSource(JsonSchemaMixin):
         self.__dblp_json_set_type(item=item, session=session)
         if "title" in item:
             item["title"] = item["title"].rstrip(".").rstrip().replace("\n", " ")
-            item["title"] = re.sub(r"\s+", " ", item["title"])
+            item["title"] = " ".join(item["title"].split())
         if "pages" in item:
             item["pages"] = item["pages"].replace("-", "--")
         if "authors" in item:
@@ -289,7 +301,7 @@ class DBLPSearchSource(JsonSchemaMixin):
             if ret.status_code == 500:
                 return []
 
-            data = json.loads(ret.text)
+            data = json.loads(ret.content)
             if "hits" not in data["result"]:
                 return []
             if "hit" not in data["result"]["hits"]:
@@ -328,6 +340,24 @@ class DBLPSearchSource(JsonSchemaMixin):
 
         return retrieved_records
 
+    def __get_title_key(self, *, title: str) -> str:
+        return unicodedata.normalize("NFKD", title).lower().strip()
+
+    def __retrieve_dblp_records_by_title(self, *, title: str) -> list:
+        title_key = self.__get_title_key(title=title)
+        if title_key not in self.__title_cache:
+            query = "" + title.replace("-", "_")
+            self.__title_cache[title_key] = [
+                retrieved_record.data
+                for retrieved_record in self.__retrieve_dblp_records(query=query)
+            ]
+        # Note : copies are returned because retrieved records are modified
+        # (e.g., IDs set when adding them to the feed)
+        return [
+            colrev.record.PrepRecord(data=deepcopy(retrieved_record_dict))
+            for retrieved_record_dict in self.__title_cache[title_key]
+        ]
+
     def validate_source(
         self,
         search_operation: colrev.ops.search.Search,
@@ -638,17 +668,16 @@ class DBLPSearchSource(JsonSchemaMixin):
         if any(self.origin_prefix in o for o in record.data["colrev_origin"]):
             # Already linked to a crossref record
             return record
+        if "title" not in record.data:
+            # Note : the query is based on the title
+            return record
 
-        same_record_type_required = (
-            prep_operation.review_manager.settings.is_curated_masterdata_repo()
-        )
         self.__timeout = timeout
 
         try:
             # Note: queries combining title+author/journal do not seem to work any more
-            query = "" + record.data.get("title", "").replace("-", "_")
-            for retrieved_record in self.__retrieve_dblp_records(
-                query=query,
+            for retrieved_record in self.__retrieve_dblp_records_by_title(
+                title=record.data["title"]
             ):
                 if "dblp_key" in record.data:
                     if retrieved_record.data["dblp_key"] != record.data["dblp_key"]:
@@ -657,7 +686,7 @@ class DBLPSearchSource(JsonSchemaMixin):
                 similarity = colrev.record.PrepRecord.get_retrieval_similarity(
                     record_original=record,
                     retrieved_record_original=retrieved_record,
-                    same_record_type_required=same_record_type_required,
+                    same_record_type_required=self.__same_record_type_required,
                 )
                 if similarity > prep_operation.retrieval_similarity:
                     try:
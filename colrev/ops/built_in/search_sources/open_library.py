@@ -49,6 +49,7 @@ class OpenLibrarySearchSource(JsonSchemaMixin):
         + "colrev/ops/built_in/search_sources/open_library.md"
     )
     __open_library_md_filename = Path("data/search/md_open_library.bib")
+    __ISBN_SEPARATORS = str.maketrans("", "", "- ")
 
     def __init__(
         self,
@@ -156,12 +157,11 @@ class OpenLibrarySearchSource(JsonSchemaMixin):
     def __get_record_from_open_library(
         self, *, prep_operation: colrev.ops.prep.Prep, record: colrev.record.Record
     ) -> colrev.record.Record:
-        session = prep_operation.review_manager.get_cached_session()
-
         url = "NA"
         if "isbn" in record.data:
-            isbn = record.data["isbn"].replace("-", "").replace(" ", "")
+            isbn = record.data["isbn"].translate(self.__ISBN_SEPARATORS)
             url = f"https://openlibrary.org/isbn/{isbn}.json"
+            session = prep_operation.review_manager.get_cached_session()
             ret = session.request(
                 "GET",
                 url,
@@ -170,10 +170,10 @@ class OpenLibrarySearchSource(JsonSchemaMixin):
             )
             ret.raise_for_status()
             # prep_operation.review_manager.logger.debug(url)
-            if '"error": "notfound"' in ret.text:
+            if b'"error": "notfound"' in ret.content:
                 record.remove_field(key="isbn")
 
-            item = json.loads(ret.text)
+            item = json.loads(ret.content)
 
         else:
             base_url = "https://openlibrary.org/search.json?"
@@ -204,6 +204,8 @@ class OpenLibrarySearchSource(JsonSchemaMixin):
             if ":" in title:
                 title = title[: title.find(":")]  # To catch sub-titles
             url = url + "&title=" + title.replace(" ", "+")
+            # Note : the session is only created once the query is complete
+            session = prep_operation.review_manager.get_cached_session()
             ret = session.request(
                 "GET",
                 url,
@@ -214,12 +216,12 @@ class OpenLibrarySearchSource(JsonSchemaMixin):
             # prep_operation.review_manager.logger.debug(url)
 
             # if we have an exact match, we don't need to check the similarity
-            if '"numFoundExact": true,' not in ret.text:
+            if b'"numFoundExact": true,' not in ret.content:
                 raise colrev_exceptions.RecordNotFoundInPrepSourceException(
                     msg="OpenLibrary: numFoundExact true missing"
                 )
 
-            data = json.loads(ret.text)
+            data = json.loads(ret.content)
             items = data["docs"]
             if not items:
                 raise colrev_exceptions.RecordNotFoundInPrepSourceException(
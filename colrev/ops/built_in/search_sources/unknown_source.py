@@ -46,6 +46,14 @@ class UnknownSearchSource(JsonSchemaMixin):
     )
 
     HTML_CLEANER = re.compile("<.*?>")
+    YEAR_REGEX = re.compile(r"\d{4}")
+    # Note : years, ordinals, abbreviations and "Proceedings (of the)"
+    BOOKTITLE_CLEANER = re.compile(
+        r"\d{4}|\d{1,2}(?:th|nd|rd|st)|\([A-Z]{3,6}\)|Proceedings(?: of the)?"
+    )
+    AUTHOR_NICKNAME_REGEX = re.compile(r"\([^)]*\)")
+    PAGES_REGEX = re.compile(r"^\d*(?:--\d*)?$")
+    ROMAN_PAGES_REGEX = re.compile(r"^[xivXIV]*--[xivXIV]*$")
     __padding = 40
 
     def __init__(
@@ -204,22 +212,12 @@ class UnknownSearchSource(JsonSchemaMixin):
         if record.data.get("booktitle", "UNKNOWN") == "UNKNOWN":
             return
 
-        if (
-            "UNKNOWN" != record.data["booktitle"]
-            and "inbook" != record.data["ENTRYTYPE"]
-        ):
+        if "inbook" != record.data["ENTRYTYPE"]:
             record.format_if_mostly_upper(key="booktitle", case="title")
 
-            stripped_btitle = re.sub(r"\d{4}", "", record.data["booktitle"])
-            stripped_btitle = re.sub(r"\d{1,2}th", "", stripped_btitle)
-            stripped_btitle = re.sub(r"\d{1,2}nd", "", stripped_btitle)
-            stripped_btitle = re.sub(r"\d{1,2}rd", "", stripped_btitle)
-            stripped_btitle = re.sub(r"\d{1,2}st", "", stripped_btitle)
-            stripped_btitle = re.sub(r"\([A-Z]{3,6}\)", "", stripped_btitle)
-            stripped_btitle = stripped_btitle.replace("Proceedings of the", "").replace(
-                "Proceedings", ""
-            )
-            stripped_btitle = stripped_btitle.lstrip().rstrip()
+            stripped_btitle = self.BOOKTITLE_CLEANER.sub(
+                "", record.data["booktitle"]
+            ).strip()
             record.update_field(
                 key="booktitle",
                 value=stripped_btitle,
@@ -228,17 +226,15 @@ class UnknownSearchSource(JsonSchemaMixin):
             )
 
     def __format_article(self, record: colrev.record.PrepRecord) -> None:
-        if (
-            record.data.get("journal", "UNKNOWN") != "UNKNOWN"
-            and len(record.data["journal"]) > 10
-            and "UNKNOWN" != record.data["journal"]
-        ):
+        journal = record.data.get("journal", "UNKNOWN")
+        if journal != "UNKNOWN" and len(journal) > 10:
             record.format_if_mostly_upper(key="journal", case="title")
 
-        if record.data.get("volume", "UNKNOWN") != "UNKNOWN":
+        volume = record.data.get("volume", "UNKNOWN")
+        if volume != "UNKNOWN":
             record.update_field(
                 key="volume",
-                value=record.data["volume"].replace("Volume ", ""),
+                value=volume.replace("Volume ", ""),
                 source="unkown_source_prep",
                 keep_source_if_equal=True,
             )
@@ -246,26 +242,28 @@ class UnknownSearchSource(JsonSchemaMixin):
     def __format_fields(self, *, record: colrev.record.PrepRecord) -> None:
         """Format fields"""
 
-        if record.data.get("entrytype", "") == "inproceedings":
+        entrytype = record.data.get("entrytype", "")
+        if entrytype == "inproceedings":
             self.__format_inproceedings(record=record)
-        elif record.data.get("entrytype", "") == "article":
+        elif entrytype == "article":
             self.__format_article(record=record)
 
-        if record.data.get("author", "UNKNOWN") != "UNKNOWN":
+        author = record.data.get("author", "UNKNOWN")
+        if author != "UNKNOWN":
             # fix name format
-            if (1 == len(record.data["author"].split(" ")[0])) or (
-                ", " not in record.data["author"]
-            ):
+            if (1 == len(author.split(" ")[0])) or (", " not in author):
                 record.update_field(
                     key="author",
                     value=colrev.record.PrepRecord.format_author_field(
-                        input_string=record.data["author"]
+                        input_string=author
                     ),
                     source="unkown_source_prep",
                     keep_source_if_equal=True,
                 )
             # Replace nicknames in parentheses
-            record.data["author"] = re.sub(r"\([^)]*\)", "", record.data["author"])
+            record.data["author"] = self.AUTHOR_NICKNAME_REGEX.sub(
+                "", record.data["author"]
+            )
             record.data["author"] = record.data["author"].replace("  ", " ").rstrip()
 
         if record.data.get("title", "UNKNOWN") != "UNKNOWN":
@@ -273,21 +271,15 @@ class UnknownSearchSource(JsonSchemaMixin):
 
         if "pages" in record.data:
             record.unify_pages_field()
-            if (
-                not re.match(r"^\d*$", record.data["pages"])
-                and not re.match(r"^\d*--\d*$", record.data["pages"])
-                and not re.match(r"^[xivXIV]*--[xivXIV]*$", record.data["pages"])
-            ):
+            if not self.PAGES_REGEX.match(
+                record.data["pages"]
+            ) and not self.ROMAN_PAGES_REGEX.match(record.data["pages"]):
                 self.review_manager.report_logger.info(
                     f' {record.data["ID"]}:'.ljust(self.__padding, " ")
                     + f'Unusual pages: {record.data["pages"]}'
                 )
 
-        if (
-            "url" in record.data
-            and "fulltext" in record.data
-            and record.data["url"] == record.data["fulltext"]
-        ):
+        if "url" in record.data and record.data["url"] == record.data.get("fulltext"):
             record.remove_field(key="fulltext")
 
         if "language" in record.data:
@@ -330,7 +322,7 @@ class UnknownSearchSource(JsonSchemaMixin):
 
     def __impute_missing_fields(self, *, record: colrev.record.PrepRecord) -> None:
         if "date" in record.data and "year" not in record.data:
-            year = re.search(r"\d{4}", record.data["date"])
+            year = self.YEAR_REGEX.search(record.data["date"])
             if year:
                 record.update_field(
                     key="year",
@@ -350,8 +342,8 @@ class UnknownSearchSource(JsonSchemaMixin):
             ]:
                 continue
             if field in ["author", "title", "journal"]:
-                record.data[field] = re.sub(r"\s+", " ", record.data[field])
-                record.data[field] = re.sub(self.HTML_CLEANER, "", record.data[field])
+                record.data[field] = " ".join(record.data[field].split())
+                record.data[field] = self.HTML_CLEANER.sub("", record.data[field])
 
     def prepare(
         self, record: colrev.record.PrepRecord, source: colrev.settings.SearchSource
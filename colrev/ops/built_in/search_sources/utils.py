@@ -113,9 +113,9 @@ def __format_fields(*, record_dict: dict) -> dict:
         value = value.replace("<scp>", "{")
         value = value.replace("</scp>", "}")
         value = html.unescape(value)
-        value = re.sub(TAG_RE, " ", value)
+        value = TAG_RE.sub(" ", value)
         value = value.replace("\n", " ")
-        value = re.sub(r"\s+", " ", value).rstrip().lstrip("▪ ")
+        value = " ".join(value.split()).lstrip("▪ ")
         if key == "abstract":
             if value.startswith("Abstract "):
                 value = value[8:]
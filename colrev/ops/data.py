@@ -2,16 +2,42 @@
 """CoLRev data operation: extract data, analyze, and synthesize."""
 from __future__ import annotations
 
+import multiprocessing as mp
 from pathlib import Path
 from typing import Optional
 
 import pandas as pd
 
+import colrev.env.tei_parser
 import colrev.operation
 import colrev.ops.built_in.pdf_prep.tei_prep
 import colrev.record
 import colrev.ui_cli.cli_colors as colors
 
+# Note : records and environment_manager are passed to each worker process once
+# (in the pool initializer) instead of once per TEI
+MARK_REFERENCES_CONTEXT: dict = {}
+
+
+def init_mark_references_worker(
+    records: dict,
+    environment_manager: colrev.env.environment_manager.EnvironmentManager,
+) -> None:
+    """Initialize a worker process for mark_references_in_tei()"""
+    MARK_REFERENCES_CONTEXT["records"] = records
+    MARK_REFERENCES_CONTEXT["environment_manager"] = environment_manager
+
+
+# Note : no named arguments (multiprocessing)
+def mark_references_in_tei(tei_file: Path) -> str:
+    """Mark the references in a TEI and return the TEI string"""
+    tei_doc = colrev.env.tei_parser.TEIParser(
+        environment_manager=MARK_REFERENCES_CONTEXT["environment_manager"],
+        tei_path=tei_file,
+    )
+    tei_doc.mark_references(records=MARK_REFERENCES_CONTEXT["records"])
+    return tei_doc.get_tei_str()
+
 
 class Data(colrev.operation.Operation):
     """Class supporting structured and unstructured
@@ -45,6 +71,15 @@ class Data(colrev.operation.Operation):
             ]
         ]
 
+    def __mark_references_in_teis(self, *, records: dict, tei_files: list) -> list:
+        # Note : marking the references is CPU-bound and independent for each TEI
+        # (processes instead of threads)
+        with mp.Pool(
+            initializer=init_mark_references_worker,
+            initargs=(records, self.review_manager.environment_manager),
+        ) as pool:
+            return pool.map(mark_references_in_tei, tei_files)
+
     def reading_heuristics(self) -> list:
         """Determine heuristics for the reading process"""
 
@@ -68,16 +103,17 @@ class Data(colrev.operation.Operation):
         required_records_ids = self.get_record_ids_for_synthesis(records)
 
         missing = []
+        tei_files = []
         for required_records_id in required_records_ids:
             tei_file = tei_path / Path(f"{required_records_id}.tei.xml")
             if not tei_file.is_file():
                 missing.append(required_records_id)
+                continue
+            tei_files.append(tei_file)
 
-            tei_doc = self.review_manager.get_tei(
-                tei_path=tei_file,
-            )
-            tei_doc.mark_references(records=records)
-            data = tei_doc.get_tei_str()
+        for data in self.__mark_references_in_teis(
+            records=records, tei_files=tei_files
+        ):
             for enlit_item in enlit_list:
                 id_string = f'ID="{enlit_item["ID"]}"'
                 if id_string in data:
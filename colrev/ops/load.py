@@ -42,6 +42,14 @@ class Load(colrev.operation.Operation):
         "\\'o": "ó",
     }
 
+    # Note : upper-case (compared with upper-case DOIs)
+    __DOI_URL_PREFIXES = (
+        "HTTPS://DOI.ORG/",
+        "HTTP://DOI.ORG/",
+        "HTTPS://DX.DOI.ORG/",
+        "HTTP://DX.DOI.ORG/",
+    )
+
     def __init__(
         self,
         *,
@@ -611,7 +619,7 @@ class Load(colrev.operation.Operation):
                     .replace("}", "")
                 )
         if record.data.get("title", "UNKNOWN") != "UNKNOWN":
-            record.data["title"] = re.sub(r"\s+", " ", record.data["title"]).rstrip(".")
+            record.data["title"] = " ".join(record.data["title"].split()).rstrip(".")
 
         if "year" in record.data:
             if str(record.data["year"]).endswith(".0"):
@@ -652,6 +660,13 @@ class Load(colrev.operation.Operation):
                     record.data["url"].find("login?url=https") + 10 :
                 ]
 
+    def __format_doi(self, *, doi: str) -> str:
+        doi = doi.upper()
+        for prefix in self.__DOI_URL_PREFIXES:
+            if doi.startswith(prefix):
+                return doi[len(prefix) :]
+        return doi
+
     def __import_record(self, *, record_dict: dict) -> dict:
         self.review_manager.logger.debug(
             f'import_record {record_dict["ID"]}: '
@@ -663,9 +678,7 @@ class Load(colrev.operation.Operation):
             self.__import_process_fields(record=record)
 
         if "doi" in record.data:
-            record.data.update(
-                doi=record.data["doi"].replace("http://dx.doi.org/", "").upper()
-            )
+            record.data.update(doi=self.__format_doi(doi=record.data["doi"]))
         self.import_provenance(
             record=record,
         )
@@ -720,15 +733,7 @@ class Load(colrev.operation.Operation):
                 record.update(colrev_status=colrev.record.RecordState.md_retrieved)
 
             if "doi" in record:
-                formatted_doi = (
-                    record["doi"]
-                    .lower()
-                    .replace("https://", "http://")
-                    .replace("dx.doi.org", "doi.org")
-                    .replace("http://doi.org/", "")
-                    .upper()
-                )
-                record.update(doi=formatted_doi)
+                record.update(doi=self.__format_doi(doi=record["doi"]))
 
             self.review_manager.logger.debug(
                 f'append record {record["ID"]} '
@@ -14,7 +14,7 @@ class DOIPatternChecker:
 
     msg = "doi-not-matching-pattern"
     # https://www.crossref.org/blog/dois-and-matching-regular-expressions/
-    __DOI_REGEX = r"^10.\d{4,9}\/"
+    __DOI_REGEX = re.compile(r"^10\.\d{4,9}/")
 
     def __init__(self, quality_model: colrev.qm.quality_model.QualityModel) -> None:
         self.quality_model = quality_model
@@ -25,7 +25,7 @@ class DOIPatternChecker:
         if "doi" not in record.data:
             return
 
-        if not re.match(self.__DOI_REGEX, record.data["doi"]):
+        if not self.__DOI_REGEX.match(record.data["doi"]):
             record.add_masterdata_provenance_note(key="doi", note=self.msg)
         else:
             record.remove_masterdata_provenance_note(key="doi", note=self.msg)
@@ -2,8 +2,10 @@
 """Checker for inconsistent-with-doi-metadata."""
 from __future__ import annotations
 
+import typing
+
 import requests.exceptions
-from thefuzz import fuzz
+from rapidfuzz import fuzz
 
 import colrev.exceptions as colrev_exceptions
 import colrev.ops.built_in.search_sources.crossref as crossref_connector
@@ -23,6 +25,9 @@ class InconsistentWithDOIMetadataChecker:
         self.__etiquette = crossref_connector.CrossrefSearchSource.get_etiquette(
             review_manager=quality_model.review_manager
         )
+        # Note : the Crossref metadata is cached per DOI
+        # (the checker runs whenever records are validated)
+        self.__crossref_md_by_doi: typing.Dict[str, colrev.record.PrepRecord] = {}
 
     def run(self, *, record: colrev.record.Record) -> None:
         """Run the inconsistent-with-doi-metadata checks"""
@@ -41,13 +46,19 @@ class InconsistentWithDOIMetadataChecker:
         else:
             record.remove_masterdata_provenance_note(key="doi", note=self.msg)
 
-    def __doi_metadata_conflicts(self, *, record: colrev.record.Record) -> bool:
-        record_copy = record.copy_prep_rec()
-
-        try:
+    def __get_crossref_md(self, *, doi: str) -> colrev.record.PrepRecord:
+        # Note : DOIs are case-insensitive
+        doi_key = doi.lower()
+        if doi_key not in self.__crossref_md_by_doi:
             crossref_md = crossref_connector.CrossrefSearchSource.query_doi(
-                doi=record_copy.data["doi"], etiquette=self.__etiquette
+                doi=doi, etiquette=self.__etiquette
             )
+            self.__crossref_md_by_doi[doi_key] = crossref_md
+        return self.__crossref_md_by_doi[doi_key]
+
+    def __doi_metadata_conflicts(self, *, record: colrev.record.Record) -> bool:
+        try:
+            crossref_md = self.__get_crossref_md(doi=record.data["doi"])
 
             for key, value in crossref_md.data.items():
                 if key not in self.__fields_to_check:
@@ -62,10 +73,14 @@ class InconsistentWithDOIMetadataChecker:
                     continue
                 if len(crossref_md.data[key]) < 5 or len(record.data[key]) < 5:
                     continue
+                record_value = record.data[key].lower()
+                crossref_value = crossref_md.data[key].lower()
+                # Note : substrings have a partial_ratio of 100 (no need to compute it)
+                if record_value in crossref_value or crossref_value in record_value:
+                    continue
+                # Note : score_cutoff allows rapidfuzz to stop early (returns 0)
                 if (
-                    fuzz.partial_ratio(
-                        record.data[key].lower(), crossref_md.data[key].lower()
-                    )
+                    fuzz.partial_ratio(record_value, crossref_value, score_cutoff=60)
                     < 60
                 ):
                     return True
@@ -2,7 +2,7 @@
 """Checker for inconsistent-with-url-metadata."""
 from __future__ import annotations
 
-from thefuzz import fuzz
+from rapidfuzz import fuzz
 
 import colrev.ops.built_in.search_sources.website as website_connector
 import colrev.qm.quality_model
@@ -39,7 +39,7 @@ class InconsistentWithURLMetadataChecker:
             record.remove_masterdata_provenance_note(key="url", note=self.msg)
 
     def __url_metadata_conflicts(self, *, record: colrev.record.Record) -> bool:
-        url_record = record.copy_prep_rec()
+        url_record = record.project_prep_rec(keys=["url"] + self.__fields_to_check)
         self.__url_connector.retrieve_md_from_website(record=url_record)
         for key, value in url_record.data.items():
             if key not in self.__fields_to_check:
@@ -49,12 +49,11 @@ class InconsistentWithURLMetadataChecker:
             if key in record.data:
                 if len(url_record.data[key]) < 5 or len(record.data[key]) < 5:
                     continue
-                if (
-                    fuzz.partial_ratio(
-                        record.data[key].lower(), url_record.data[key].lower()
-                    )
-                    < 70
-                ):
+                record_value = record.data[key].lower()
+                url_value = url_record.data[key].lower()
+                if record_value in url_value or url_value in record_value:
+                    continue
+                if fuzz.partial_ratio(record_value, url_value, score_cutoff=70) < 70:
                     return True
 
         return False
@@ -18,17 +18,39 @@ class ISBNPatternChecker:
         "^(?:ISBN(?:-1[03])?:? )?(?=[-0-9 ]{17}$|[-0-9X ]{13}$|[0-9X]{10}$)|"
         "(?:97[89][- ]?)?[0-9]{1,5}[- ]?(?:[0-9]+[- ]?){2}[0-9X]$"
     )
+    __ISBN_PREFIX_REGEX = re.compile("^ISBN(?:-1[03])?:? ")
+    __ISBN_SEPARATORS = str.maketrans("", "", "- ")
 
     def __init__(self, quality_model: colrev.qm.quality_model.QualityModel) -> None:
         self.quality_model = quality_model
 
+    def __has_valid_check_digit(self, *, isbn: str) -> bool:
+        isbn = self.__ISBN_PREFIX_REGEX.sub("", isbn).translate(self.__ISBN_SEPARATORS)
+        if len(isbn) == 10:
+            if not isbn[:9].isdigit():
+                return False
+            digits = [int(c) for c in isbn[:9]]
+            digits.append(10 if isbn[9] == "X" else int(isbn[9]))
+            return sum((10 - i) * d for i, d in enumerate(digits)) % 11 == 0
+        if len(isbn) == 13:
+            if not isbn.isdigit():
+                return False
+            return (
+                sum(int(c) * (1 if i % 2 == 0 else 3) for i, c in enumerate(isbn)) % 10
+                == 0
+            )
+        # Note : other lengths are handled by the pattern
+        return True
+
     def run(self, *, record: colrev.record.Record) -> None:
         """Run the isbn-not-matching-pattern checks"""
 
         if "isbn" not in record.data:
             return
 
-        if not re.match(self.__ISBN_REGEX, record.data["isbn"]):
+        if not self.__ISBN_REGEX.match(
+            record.data["isbn"]
+        ) or not self.__has_valid_check_digit(isbn=record.data["isbn"]):
             record.add_masterdata_provenance_note(key="isbn", note=self.msg)
         else:
             record.remove_masterdata_provenance_note(key="isbn", note=self.msg)
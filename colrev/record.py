@@ -11,12 +11,12 @@ import textwrap
 import typing
 from copy import deepcopy
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from typing import TYPE_CHECKING
 
 import dictdiffer
-import pandas as pd
 import pdfminer
 from nameparser import HumanName
 from pdfminer.converter import TextConverter
@@ -129,6 +129,11 @@ class Record:
         """Copy the record object (as a PrepRecord)"""
         return PrepRecord(data=deepcopy(self.data))
 
+    def project_prep_rec(self, *, keys: typing.Iterable[str]) -> PrepRecord:
+        """Copy selected fields of the record object (as a PrepRecord)"""
+        # Note : shallow copy (avoids copying the provenance dicts)
+        return PrepRecord(data={k: self.data[k] for k in keys if k in self.data})
+
     def update_by_record(self, *, update_record: Record) -> None:
         """Update all data of a record object based on another record"""
         self.data = update_record.copy_prep_rec().get_data()
@@ -274,18 +279,23 @@ class Record:
         else:
             return self.data[key]
 
-    def get_colrev_id(self) -> list:
-        """Get the colrev_id of a record"""
+    @classmethod
+    def get_colrev_id_from_dict(cls, *, data: dict) -> list:
+        """Get the colrev_id of a record dict (without instantiating a Record)"""
         # Note : do not automatically create colrev_ids
         # or at least keep in mind that this will not be possible for some records
         colrev_id = []
-        if "colrev_id" in self.data:
-            if isinstance(self.data["colrev_id"], str):
-                colrev_id = [cid.lstrip() for cid in self.data["colrev_id"].split(";")]
-            elif isinstance(self.data["colrev_id"], list):
-                colrev_id = self.data["colrev_id"]
+        if "colrev_id" in data:
+            if isinstance(data["colrev_id"], str):
+                colrev_id = [cid.lstrip() for cid in data["colrev_id"].split(";")]
+            elif isinstance(data["colrev_id"], list):
+                colrev_id = data["colrev_id"]
         return [c for c in colrev_id if len(c) > 20]
 
+    def get_colrev_id(self) -> list:
+        """Get the colrev_id of a record"""
+        return self.get_colrev_id_from_dict(data=self.data)
+
     def has_overlapping_colrev_id(self, *, record: Record) -> bool:
         """Check if a record has an overlapping colrev_id with the other record"""
         own_colrev_ids = self.get_colrev_id()
@@ -923,8 +933,9 @@ class Record:
     @classmethod
     def get_record_similarity(cls, *, record_a: Record, record_b: Record) -> float:
         """Determine the similarity between two records (their masterdata)"""
-        record_a_dict = record_a.copy().get_data()
-        record_b_dict = record_b.copy().get_data()
+        # Note : shallow copies suffice (only top-level fields are set)
+        record_a_dict = record_a.data.copy()
+        record_b_dict = record_b.data.copy()
 
         mandatory_fields = [
             "title",
@@ -957,10 +968,7 @@ class Record:
                 + record_b_dict.get("series", "")
             )
 
-        df_a = pd.DataFrame.from_dict([record_a_dict])  # type: ignore
-        df_b = pd.DataFrame.from_dict([record_b_dict])  # type: ignore
-
-        return Record.get_similarity(df_a=df_a.iloc[0], df_b=df_b.iloc[0])
+        return Record.get_similarity(df_a=record_a_dict, df_b=record_b_dict)
 
     @classmethod
     def get_similarity(cls, *, df_a: dict, df_b: dict) -> float:
@@ -1721,12 +1729,12 @@ class PrepRecord(Record):
 
         return author_string
 
-    @classmethod
-    def __format_authors_string_for_comparison(cls, *, record: Record) -> None:
-        if "author" not in record.data:
-            return
-        authors = record.data["author"]
-        authors = str(authors).lower()
+    # Note : the formatted authors are cached based on the field value
+    # (the same record is compared with many candidates and by several endpoints)
+    @staticmethod
+    @lru_cache(maxsize=10000)
+    def __get_authors_string_for_comparison(authors: str) -> str:
+        authors = authors.lower()
         authors_string = ""
         authors = colrev.env.utils.remove_accents(input_str=authors)
 
@@ -1748,7 +1756,15 @@ class PrepRecord(Record):
             else:
                 authors_string = authors_string + author + " "
         authors_string = re.sub(r"[^A-Za-z0-9, ]+", "", authors_string.rstrip())
-        record.data["author"] = authors_string
+        return authors_string
+
+    @classmethod
+    def __format_authors_string_for_comparison(cls, *, record: Record) -> None:
+        if "author" not in record.data:
+            return
+        record.data["author"] = cls.__get_authors_string_for_comparison(
+            str(record.data["author"])
+        )
 
     def container_is_abbreviated(self) -> bool:
         """Check whether the container title is abbreviated"""
@@ -1859,8 +1875,9 @@ class PrepRecord(Record):
             ) != retrieved_record_original.data.get("ENTRYTYPE", "b"):
                 return 0.0
 
-        record = record_original.copy_prep_rec()
-        retrieved_record = retrieved_record_original.copy_prep_rec()
+        # Note : shallow copies suffice (only top-level fields are modified)
+        record = PrepRecord(data=record_original.data.copy())
+        retrieved_record = PrepRecord(data=retrieved_record_original.data.copy())
 
         cls.__prep_records_for_similarity(
             record=record, retrieved_record=retrieved_record
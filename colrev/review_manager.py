@@ -12,8 +12,10 @@ from pathlib import Path
 from typing import Optional
 
 import git
+import requests.adapters
 import requests_cache
 import yaml
+from urllib3.util.retry import Retry
 
 import colrev.checker
 import colrev.dataset
@@ -57,6 +59,17 @@ class ReviewManager:
 
     OUTPUT_DIR_RELATIVE = Path("output")
 
+    # Note : sessions are shared by the threads preparing records in parallel
+    HTTP_POOL_MAXSIZE = 128
+    HTTP_RETRY_STATUS_CODES = [429, 502, 503, 504]
+    # Note : metadata that changes more frequently expires earlier
+    # (default: 30 days)
+    HTTP_CACHE_URLS_EXPIRE_AFTER: dict = {
+        "dblp.org": timedelta(days=7),
+        "api.semanticscholar.org": timedelta(days=14),
+        "openlibrary.org": timedelta(days=30),
+    }
+
     dataset: colrev.dataset.Dataset
     """The review dataset object"""
 
@@ -451,11 +464,34 @@ class ReviewManager:
     def get_cached_session(cls) -> requests_cache.CachedSession:
         """Get a cached session"""
 
-        return requests_cache.CachedSession(
+        session = requests_cache.CachedSession(
             str(colrev.env.environment_manager.EnvironmentManager.cache_path),
             backend="sqlite",
             expire_after=timedelta(days=30),
+            urls_expire_after=cls.HTTP_CACHE_URLS_EXPIRE_AFTER,
+            # Note : not-found responses are cached to avoid repeating lookups
+            allowable_codes=(200, 404),
+            # Note : return cached responses if the services are not available
+            stale_if_error=True,
+            # Note : write-ahead logging allows concurrent reads during writes
+            # (e.g., when records are prepared in parallel)
+            wal=True,
+        )
+        # Note : connections are kept alive and reused (pool_maxsize) and
+        # rate limits/gateway errors are retried with a backoff.
+        # raise_on_status=False: the last response is returned (not an exception)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=cls.HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=cls.HTTP_RETRY_STATUS_CODES,
+                raise_on_status=False,
+            ),
         )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     @classmethod
     def get_zotero_translation_service(
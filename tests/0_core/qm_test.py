@@ -348,6 +348,7 @@ def test_get_quality_defects_missing_fields(
         ("10.1177/02683962211048201", False),
         ("10.5555/2014-04-01", False),
         ("https://journals.sagepub.com/doi/10.1177/02683962211048201", True),
+        ("10X1177/02683962211048201", True),
     ],
 )
 def test_doi_not_matching_pattern(
@@ -379,6 +380,9 @@ def test_doi_not_matching_pattern(
         ("10.1177/02683962211048201", True),
         ("978-3-16-148410-0", False),
         ("978-1605666594", False),
+        ("0-306-40615-2", False),
+        ("978-3-16-148410-1", True),
+        ("0-306-40615-3", True),
     ],
 )
 def test_isbn_not_matching_pattern(
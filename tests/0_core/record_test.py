@@ -76,6 +76,16 @@ def test_copy() -> None:
     assert r1 == r1_cop
 
 
+def test_project_prep_rec() -> None:
+    """Test record.project_prep_rec()"""
+    prep_rec = r1.project_prep_rec(keys=["title", "year", "url"])
+    assert isinstance(prep_rec, colrev.record.PrepRecord)
+    assert {"title": r1.data["title"], "year": r1.data["year"]} == prep_rec.data
+
+    prep_rec.data["title"] = "Changed title"
+    assert "Changed title" != r1.data["title"]
+
+
 def test_update_field() -> None:
     """Test record.update_field()"""
     r2_mod = r2.copy()
@@ -1,11 +1,15 @@
 #!/usr/bin/env python
 """Test the local_index"""
+import hashlib
+import sqlite3
+import zlib
 from pathlib import Path
 
 import pytest
 
 import colrev.env.local_index
 import colrev.env.tei_parser
+import colrev.record
 import colrev.review_manager
 
 # pylint: disable=line-too-long
@@ -103,6 +107,7 @@ def test_search(local_index) -> None:  # type: ignore
                 "colrev_data_provenance": {
                     "doi": {"note": "", "source": "CROSSREF.bib/000516"},
                     "url": {"note": "", "source": "DBLP.bib/000528"},
+                    "literature_review": {"note": "", "source": "CURATED:gh..."},
                 },
                 "colrev_masterdata_provenance": {
                     "CURATED": {"note": "", "source": "gh..."}
@@ -111,7 +116,7 @@ def test_search(local_index) -> None:  # type: ignore
                 "curation_ID": "gh...#AlaviLeidner2001",
                 "doi": "10.2307/3250961",
                 "journal": "MIS Quarterly",
-                # TODO : should expect literature_review = True (layered field?!)
+                "literature_review": "yes",
                 "language": "eng",
                 "number": "1",
                 "title": "Review: Knowledge Management and Knowledge Management Systems: Conceptual Foundations and Research Issues",
@@ -153,6 +158,171 @@ def test_get_fields_to_remove(local_index) -> None:  # type: ignore
     assert expected == actual
 
 
+@pytest.mark.parametrize(
+    "journal, toc_record_fields, expected",
+    [
+        ("Journal of Volume Tests", {"volume": "5"}, ["number"]),
+        ("Journal of Number Tests", {"number": "3"}, ["volume"]),
+        ("Journal of Outlet Tests", {}, ["number", "volume"]),
+        ("Journal of Issue Tests", {"volume": "5", "number": "3"}, []),
+    ],
+)
+def test_get_fields_to_remove_toc_variants(  # type: ignore
+    local_index, journal: str, toc_record_fields: dict, expected: list
+) -> None:
+    """Test get_fields_to_remove() for tocs without volume and/or number"""
+
+    toc_record = {
+        "ID": "VariantTest",
+        "ENTRYTYPE": "article",
+        "colrev_status": colrev.record.RecordState.md_processed,
+        "author": "Doe, John",
+        "journal": journal,
+        "title": "A variant test",
+        "year": "2020",
+        **toc_record_fields,
+    }
+    local_index.index_records(
+        records={"VariantTest": toc_record},
+        repo_source_path=Path("toc_test.bib"),
+        curated_fields=[],
+        curation_url="gh...",
+        curated_masterdata=True,
+    )
+
+    record_dict = {
+        "ENTRYTYPE": "article",
+        "journal": journal,
+        "year": "2020",
+        "volume": "5",
+        "number": "3",
+    }
+    actual = local_index.get_fields_to_remove(record_dict=record_dict)
+    assert expected == actual
+
+
+def get_toc_test_record(
+    *, title: str, colrev_status: colrev.record.RecordState
+) -> dict:
+    """Get a record of the (otherwise unused) toc-test journal"""
+    return {
+        "ID": title,
+        "ENTRYTYPE": "article",
+        "colrev_status": colrev_status,
+        "author": "Doe, John",
+        "journal": "Journal of Toc Tests",
+        "title": title,
+        "year": "2020",
+        "volume": "1",
+        "number": title[0],
+    }
+
+
+def get_toc_colrev_ids(local_index, toc_key: str) -> list:  # type: ignore
+    """Get the colrev_ids stored for a toc_key"""
+    with sqlite3.connect(local_index.SQLITE_PATH) as connection:
+        row = connection.execute(
+            "SELECT colrev_ids FROM toc_index WHERE toc_key=?", (toc_key,)
+        ).fetchone()
+    if row is None:
+        return []
+    return row[0].split(";")
+
+
+def test_index_toc_merge(local_index) -> None:  # type: ignore
+    """Test that colrev_ids are added to existing toc items (without duplicates)"""
+
+    for titles in [["1 Alpha", "1 Beta"], ["1 Beta", "1 Gamma"]]:
+        records = {
+            title: get_toc_test_record(
+                title=title, colrev_status=colrev.record.RecordState.md_processed
+            )
+            for title in titles
+        }
+        local_index.index_records(
+            records=records,
+            repo_source_path=Path("toc_test.bib"),
+            curated_fields=[],
+            curation_url="gh...",
+            curated_masterdata=True,
+        )
+
+    actual = get_toc_colrev_ids(local_index, "journal-of-toc-tests|1|1")
+    assert 3 == len(actual)
+    assert len(actual) == len(set(actual))
+
+
+def test_index_toc_dropped(local_index) -> None:  # type: ignore
+    """Test that tocs with non-processed records are not indexed"""
+
+    records = {
+        "2 Alpha": get_toc_test_record(
+            title="2 Alpha",
+            colrev_status=colrev.record.RecordState.md_needs_manual_preparation,
+        ),
+        "2 Beta": get_toc_test_record(
+            title="2 Beta", colrev_status=colrev.record.RecordState.md_processed
+        ),
+    }
+    local_index.index_records(
+        records=records,
+        repo_source_path=Path("toc_test.bib"),
+        curated_fields=[],
+        curation_url="gh...",
+        curated_masterdata=True,
+    )
+
+    assert [] == get_toc_colrev_ids(local_index, "journal-of-toc-tests|1|2")
+
+
+def test_index_tei_reuse(local_index, helpers, mocker, tmp_path) -> None:  # type: ignore
+    """Test that valid TEIs created from the same PDF are reused (without GROBID)"""
+
+    mocker.patch.object(
+        colrev.env.local_index.LocalIndex, "teiind_path", tmp_path / Path(".tei_index")
+    )
+    pdf_path = tmp_path / Path("WagnerLukyanenkoParEtAl2022.pdf")
+    helpers.retrieve_test_file(
+        source=Path("WagnerLukyanenkoParEtAl2022.pdf"), target=pdf_path
+    )
+    record_dict = get_toc_test_record(
+        title="3 Alpha", colrev_status=colrev.record.RecordState.pdf_prepared
+    )
+    record_dict.update(file=str(pdf_path), colrev_pdf_id="cpid1:test")
+
+    colrev_id = colrev.record.Record(data=record_dict.copy()).create_colrev_id()
+    paper_hash = hashlib.sha256(colrev_id.encode("utf-8")).hexdigest()
+    tei_path = tmp_path / Path(f".tei_index/{paper_hash[:2]}/{paper_hash[2:]}.tei.xml")
+    helpers.retrieve_test_file(
+        source=Path("WagnerLukyanenkoParEtAl2022.tei.xml"), target=tei_path
+    )
+    tei_path.with_suffix(".stamp").write_text("cpid1:test", encoding="utf-8")
+    expected_tei = tei_path.read_text(encoding="utf-8")
+
+    local_index.index_records(
+        records={record_dict["ID"]: record_dict},
+        repo_source_path=Path("toc_test.bib"),
+        curated_fields=[],
+        curation_url="gh...",
+        curated_masterdata=True,
+    )
+
+    with sqlite3.connect(local_index.SQLITE_PATH) as connection:
+        actual = connection.execute(
+            "SELECT tei, tei_compressed, fulltext FROM record_index WHERE id=?",
+            (paper_hash,),
+        ).fetchone()
+    assert str(tei_path) == actual[0]
+    assert expected_tei == tei_path.read_text(encoding="utf-8")
+
+    # The TEI is stored compressed in a separate column (the fulltext remains queryable)
+    expected = colrev.env.tei_parser.TEIParser(
+        environment_manager=local_index.environment_manager, tei_path=tei_path
+    ).get_tei_str()
+    assert expected == zlib.decompress(actual[1]).decode("utf-8")
+    assert "" == actual[2]
+
+
 def test_retrieve_from_toc(local_index) -> None:  # type: ignore
     """Test retrieve_from_toc()"""
 
@@ -196,6 +366,25 @@ def test_retrieve_from_toc(local_index) -> None:  # type: ignore
     assert expected == actual
 
 
+def test_retrieve_from_toc_single_item(local_index) -> None:  # type: ignore
+    """Test retrieve_from_toc() across tocs when the toc contains only one record"""
+
+    record_dict = {
+        "ENTRYTYPE": "article",
+        "ID": "AbbasZhouDengEtAl2018",
+        "author": "Abbas, Ahmed and Zhou, Yilu and Deng, Shasha and Zhang, Pengzhu",
+        "journal": "MIS Quarterly",
+        "number": "2",
+        "title": "Text Analytics to Support Sense-Making in Social Media: A Language Perspective",
+        "volume": "42",
+        "year": "2018",
+    }
+    actual = local_index.retrieve_from_toc(
+        record_dict=record_dict, similarity_threshold=0.8, search_across_tocs=True
+    )
+    assert "10.25300/MISQ/2018/13239" == actual["doi"]
+
+
 def test_retrieve_based_on_colrev_pdf_id(local_index) -> None:  # type: ignore
     """Test retrieve_based_on_colrev_pdf_id()"""
 
@@ -1660,3 +1660,44 @@ def test_tei(script_loc, tmp_path) -> None:  # type: ignore
     assert "NO_TITLE" not in actual
 
     assert "NOT_INCLUDED" not in actual
+
+
+def test_tei_incomplete_references(tmp_path) -> None:  # type: ignore
+    """Test the bibliography of a tei with incomplete references"""
+    tei_file = tmp_path / Path("incomplete.tei.xml")
+    tei_file.write_text(
+        '<TEI xmlns="http://www.tei-c.org/ns/1.0"><text><back><listBibl>'
+        '<biblStruct xml:id="b0"><monogr><title level="j">Journal</title></monogr></biblStruct>'
+        '<biblStruct xml:id="b1"><analytic><title>Title</title></analytic></biblStruct>'
+        '<biblStruct xml:id="b2"></biblStruct>'
+        "</listBibl></back></text></TEI>"
+    )
+
+    environment_manager = colrev.env.environment_manager.EnvironmentManager()
+
+    tei_doc = colrev.env.tei_parser.TEIParser(
+        environment_manager=environment_manager, tei_path=tei_file
+    )
+
+    assert [
+        {
+            "ID": "b0",
+            "ENTRYTYPE": "article",
+            "tei_id": "b0",
+            "author": "NA",
+            "title": "Journal",
+            "year": "NA",
+            "journal": "Journal",
+            "volume": "",
+            "number": "",
+            "pages": "",
+        },
+        {
+            "ID": "b1",
+            "ENTRYTYPE": "misc",
+            "tei_id": "b1",
+            "author": "NA",
+            "title": "Title",
+        },
+        {"ID": "b2", "ENTRYTYPE": "misc", "tei_id": "b2", "author": "NA", "title": ""},
+    ] == tei_doc.get_bibliography()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Test the exclude_non_latin_alphabets prep package"""
+import pytest
+
+import colrev.ops.built_in.prep.exclude_non_latin_alphabets
+import colrev.ops.prep
+
+
+@pytest.fixture(scope="package", name="enlap")
+def fixture_enlap(
+    prep_operation: colrev.ops.prep.Prep,
+) -> colrev.ops.built_in.prep.exclude_non_latin_alphabets.ExcludeNonLatinAlphabetsPrep:
+    """Fixture returning an ExcludeNonLatinAlphabetsPrep instance"""
+    settings = {"endpoint": "colrev.exclude_non_latin_alphabets"}
+    enlap_class = (
+        colrev.ops.built_in.prep.exclude_non_latin_alphabets.ExcludeNonLatinAlphabetsPrep
+    )
+    enlap_instance = enlap_class(prep_operation=prep_operation, settings=settings)
+    return enlap_instance
+
+
+@pytest.mark.parametrize(
+    "input_value, expected_status",
+    [
+        (
+            {
+                "title": "An Integrated Framework for Understanding Digital Work in Organizations",
+                "author": "Baptista, João and Stein, Mari-Klara",
+                "journal": "Journal of Strategic Information Systems",
+            },
+            None,
+        ),
+        (
+            {
+                "title": "Über die Straße: Café-Kultur",
+                "author": "Müller, Jürgen",
+            },
+            None,
+        ),
+        (
+            {
+                "title": "Исследование информационных систем",
+                "author": "Иванов, Иван",
+                "journal": "Вестник",
+            },
+            colrev.record.RecordState.rev_prescreen_excluded,
+        ),
+        (
+            {
+                "title": "信息系统研究的综述与展望",
+                "author": "王伟",
+            },
+            colrev.record.RecordState.rev_prescreen_excluded,
+        ),
+    ],
+)
+def test_prep_exclude_non_latin_alphabets(
+    enlap: colrev.ops.built_in.prep.exclude_non_latin_alphabets.ExcludeNonLatinAlphabetsPrep,
+    prep_operation: colrev.ops.prep.Prep,
+    input_value: dict,
+    expected_status: colrev.record.RecordState,
+) -> None:
+    """Test the prep_exclude_non_latin_alphabets"""
+    record = colrev.record.PrepRecord(data=input_value)
+    returned_record = enlap.prepare(prep_operation=prep_operation, record=record)
+    assert expected_status == returned_record.data.get("colrev_status")